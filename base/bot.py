@@ -1,26 +1,36 @@
 import os
 import asyncio
 import platform
+import signal
 
 import discord
 
-from base.database import Database
 from base.logger import Logger
-from base.config import BotConfig
-from base.utils.manager import Manager
-from base.utils.utilities import Utilities
-from base.utils.views.ticket_view import TicketView, UserButton, TicketDropdown
+from base.config import ConfigError
+from base.services import Services
+from base.utils.http_client import HttpClient
+from base.utils.metrics import InteractionTrackingState
+from base.utils.panel_publisher import PanelPublisher
+from base.utils.rest_metrics import rest_feature
+from base.utils.views.ticket_view import TicketView
+from base.utils.views.persistent_views import PersistentViewRegistry
 
 logger = Logger(__name__).get_logger()
 
 
 class Bot(discord.Bot):
     def __init__(self):
-        self.config = BotConfig()
-        self.utils = Utilities()
-        self.manger = Manager()
-        self.database = Database()
+        self.services = Services()
+        self.config = self.services.config
+        self.utils = self.services.utils
+        self.manger = self.services.manager
+        self.database = self.services.database
+        self.server_poller = self.services.server_poller
         super().__init__(intents=discord.Intents.all())
+        self.services.rest_accounting.install(self.http)
+        self.panel_publisher = PanelPublisher(self, self.database)
+        self.view_registry = PersistentViewRegistry(self)
+        self._started = False
 
     def load_cogs(self, directory: str, is_root: bool = True) -> None:
         if is_root:
@@ -74,11 +84,38 @@ class Bot(discord.Bot):
 
         logger.info("-" * 50)
 
+        # on_ready fires again after every re-identify, the setup and the background loops must only run once
+        if self._started:
+            logger.info("🔁 Reconnected, background tasks are already running.")
+            return
+        self._started = True
+
+        if hasattr(signal, "SIGHUP"):
+            self.loop.add_signal_handler(signal.SIGHUP, self.reload_config)
+
+        await self.database.create_database()
+        await self.database.warm_cache()
+
+        if self.config.DATABASE_WRITE_BEHIND:
+            self.database.enable_write_behind(self.config.DATABASE_FLUSH_INTERVAL_MS, self.config.DATABASE_FLUSH_MAX_OPS)
+
+        logger.info("🧷 Registering persistent views...")
+        self.view_registry.register()
+        self.services.ticket_pool.start(self.guilds[0], self.view_registry.get(TicketView).dropdown.categories)
+
+        await self.services.metrics_server.start()
+
+        logger.info("🪧 Publishing panels...")
+        with rest_feature("panels"):
+            await self.panel_publisher.publish_all()
+
         logger.info("🔧 Creating presence update task...")
         self.create_coroutine_task(
+            self.server_poller.run(),
             self.presence(),
-            self.database.create_database(),
             self.database.schedule_backup(),
+            self.services.checkout_scheduler.run(self),
+            self.services.rest_accounting.run(),
             self.manger.server_channel_total_members(self),
             self.manger.server_channel_restarter(self),
             self.manger.server_channel_status(self)
@@ -88,8 +125,40 @@ class Bot(discord.Bot):
 
         logger.info("Delta Roleplay Bot is now online. 🚀")
 
+    def _get_state(self, **options) -> InteractionTrackingState:
+        return InteractionTrackingState(
+            self.services.interaction_metrics,
+            dispatch=self.dispatch,
+            handlers=self._handlers,
+            hooks=self._hooks,
+            http=self.http,
+            loop=self.loop,
+            **options,
+        )
+
+    def reload_config(self) -> None:
+        try:
+            self.config.reload()
+        except ConfigError as e:
+            logger.error(f"❌ Konfiguration konnte nicht neu geladen werden: {e}")
+            return
+
+        self.manger.restart_schedule.reload()
+        logger.info("🔄 Konfiguration neu geladen.")
+
     async def presence(self) -> None:
+        last_players = None
+        snapshot = None
         while True:
-            players = self.utils.server_players()
-            await self.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name=players))
-            await asyncio.sleep(60)
\ No newline at end of file
+            snapshot = await self.server_poller.next_snapshot(snapshot)
+            players = snapshot.players_text
+
+            if players != last_players:
+                await self.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name=players))
+                last_players = players
+
+    async def close(self) -> None:
+        await HttpClient().close()
+        await self.services.metrics_server.close()
+        await self.database.close_connections()
+        await super().close()
\ No newline at end of file
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import aiosqlite
+
+MISSING = object()
+
+
+class BoundedCache:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        value = self._data.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return MISSING
+
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def values(self) -> List[Any]:
+        return list(self._data.values())
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class DatabaseCache:
+    MAX_USERS = 50000
+    MAX_TICKETS = 5000
+
+    def __init__(self, max_users: int = MAX_USERS, max_tickets: int = MAX_TICKETS) -> None:
+        self.users = BoundedCache(max_users)
+        self.tickets_by_channel = BoundedCache(max_tickets)
+        self.tickets_by_user = BoundedCache(max_tickets)
+        # Bumped on every write so a read-through that raced with a write does not store stale rows
+        self.generation = 0
+
+    async def warm(self, connection: aiosqlite.Connection) -> None:
+        async with connection.execute("SELECT discord_id FROM users LIMIT ?", (self.users.max_size,)) as cursor:
+            for (discord_id,) in await cursor.fetchall():
+                self.users.set(discord_id, True)
+
+        tickets_by_user: Dict[int, List[Tuple]] = {}
+        async with connection.execute("SELECT * FROM tickets LIMIT ?", (self.tickets_by_channel.max_size,)) as cursor:
+            for ticket in await cursor.fetchall():
+                self.tickets_by_channel.set(ticket[3], ticket)
+                tickets_by_user.setdefault(ticket[1], []).append(ticket)
+
+        for user_id, tickets in tickets_by_user.items():
+            self.tickets_by_user.set(user_id, tickets)
+
+    def set_user(self, discord_id: int, verified: bool) -> None:
+        self.generation += 1
+        self.users.set(discord_id, verified)
+
+    def invalidate_users(self) -> None:
+        self.generation += 1
+        self.users.clear()
+
+    def invalidate_ticket(self, uuid: Optional[str] = None, user_id: Optional[int] = None,
+                          channel_id: Optional[int] = None) -> None:
+        self.generation += 1
+        if uuid is not None:
+            # Only the uuid is known on removal, so look the ticket up in the cached entries
+            for ticket in self.tickets_by_channel.values():
+                if ticket is not None and ticket[0] == uuid:
+                    self.tickets_by_channel.pop(ticket[3])
+                    self.tickets_by_user.pop(ticket[1])
+            for tickets in self.tickets_by_user.values():
+                for ticket in tickets:
+                    if ticket[0] == uuid:
+                        self.tickets_by_user.pop(ticket[1])
+                        self.tickets_by_channel.pop(ticket[3])
+
+        if user_id is not None:
+            self.tickets_by_user.pop(user_id)
+        if channel_id is not None:
+            self.tickets_by_channel.pop(channel_id)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.users.clear()
+        self.tickets_by_channel.clear()
+        self.tickets_by_user.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "users": self.users.stats(),
+            "tickets_by_channel": self.tickets_by_channel.stats(),
+            "tickets_by_user": self.tickets_by_user.stats(),
+        }
@@ -11,7 +11,7 @@ class Checkout(commands.Cog):
 
     @slash_command(name="abmeldung", description="Melde dich vom Team ab")
     async def checkout(self, ctx: discord.ApplicationContext):
-        await ctx.send_modal(CheckoutModal())
+        await ctx.send_modal(CheckoutModal(self.bot.services))
 
 
 def setup(bot):
@@ -0,0 +1,67 @@
+import discord
+from discord.ext import commands
+from discord.commands import slash_command
+from discord.ext.bridge import has_permissions
+
+from base.logger import Logger
+from base.utils.rename_scheduler import ChannelRenameScheduler
+
+
+class Metrics(commands.Cog):
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+        self.logger = Logger(__name__).get_logger()
+        self.registry = bot.services.metrics
+        self.interaction_metrics = bot.services.interaction_metrics
+        self.rest_accounting = bot.services.rest_accounting
+        self.embeds = bot.services.embeds
+        self.database = bot.services.database
+
+    @commands.Cog.listener()
+    async def on_application_command_completion(self, ctx: discord.ApplicationContext):
+        self.interaction_metrics.completed(ctx.interaction)
+
+    @commands.Cog.listener()
+    async def on_application_command_error(self, ctx: discord.ApplicationContext, error: discord.DiscordException):
+        # A listener replaces py-cord's default traceback output, so the error is logged here instead
+        self.interaction_metrics.completed(ctx.interaction, failed=True)
+        self.logger.error(f"❌ Fehler im Befehl {ctx.command}: {error}", exc_info=error)
+
+    @slash_command(name="metrics", description="Zeigt die Latenzen der Interaktionen")
+    @has_permissions(administrator=True)
+    async def metrics(self, ctx: discord.ApplicationContext):
+        self.registry.collect()
+        rows = [
+            (labels, histogram, self.registry.counter("discord_interaction_errors_total", **labels))
+            for labels, histogram in self.registry.series("discord_interaction_ack_seconds")
+        ]
+        # Slowest first, these are the ones worth looking at
+        rows.sort(key=lambda row: row[1].percentile(0.99), reverse=True)
+
+        renames = " | ".join(
+            f"{outcome}: {int(self.registry.counter('discord_channel_renames_total', outcome=outcome))}"
+            for outcome in ChannelRenameScheduler.OUTCOMES
+        )
+        summaries = [("🔤 Kanal-Umbenennungen", renames)]
+
+        for cache in self.database.cache.stats():
+            hits = self.registry.counter("database_cache_hits_total", cache=cache)
+            misses = self.registry.counter("database_cache_misses_total", cache=cache)
+            evictions = self.registry.counter("database_cache_evictions_total", cache=cache)
+            rate = hits / (hits + misses) * 100 if hits + misses else 0
+            summaries.append((f"🗄️ Cache {cache}", f"Trefferquote: {rate:.1f}% | Treffer: {int(hits)} | "
+                                                    f"Fehlgriffe: {int(misses)} | Verdrängt: {int(evictions)}"))
+
+        icon_url = ctx.guild.icon.url if ctx.guild.icon else ""
+        await ctx.respond(embed=self.embeds.metrics.metrics_embed(rows, summaries, icon_url), ephemeral=True)
+
+    @slash_command(name="rest_report", description="Zeigt, welche Funktionen die Discord-API nutzen")
+    @has_permissions(administrator=True)
+    async def rest_report(self, ctx: discord.ApplicationContext):
+        icon_url = ctx.guild.icon.url if ctx.guild.icon else ""
+        embed = self.embeds.metrics.rest_embed(self.rest_accounting.report(), self.rest_accounting.WINDOW, icon_url)
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot):
+    bot.add_cog(Metrics(bot))
@@ -1,5 +1,8 @@
 import os
+import re
+import time
 
+import aiosqlite
 import discord
 from discord import Button
 from discord.ext import commands
@@ -7,60 +10,93 @@ from discord.commands import slash_command
 from discord.ext.bridge import has_permissions
 from discord.ui import View
 
-from base.config import BotConfig
-from base.database import Database
-from base.utils.embeds.clear_embed import EmbedClear
+from base.utils.purge_engine import PurgeEngine, PurgeFilter, PurgeProgress
+from base.utils.rest_metrics import rest_feature
 
 
 class Moderation(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.database = Database()
-        self.config = BotConfig()
+        self.database = bot.services.database
+        self.config = bot.services.config
+        self.embeds = bot.services.embeds
 
     @slash_command(name="clear", description="Löscht eine bestimmte Anzahl von Nachrichten")
     @has_permissions(manage_messages=True)
-    async def clear(self, ctx: discord.ApplicationContext, amount: int = 1):
-        await ctx.channel.purge(limit=amount + 1, check=lambda m: not m.pinned)
-        await ctx.respond(embed=EmbedClear().clear_embed(amount, ctx.guild.icon.url), ephemeral=True)
+    async def clear(self, ctx: discord.ApplicationContext, amount: int = 1, author: discord.Member = None,
+                    pattern: str = None, attachments_only: bool = False, before: str = None, after: str = None):
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE) if pattern else None
+            before = discord.Object(int(before)) if before else None
+            after = discord.Object(int(after)) if after else None
+        except (re.error, ValueError) as e:
+            await ctx.respond(f"Ungültiger Filter: {e}", ephemeral=True)
+            return
+
+        await ctx.defer(ephemeral=True)
+
+        check = PurgeFilter(author, compiled, attachments_only)
+        with rest_feature("purge"):
+            result = await PurgeEngine().purge_matching(ctx.channel, check, amount, before=before, after=after)
+
+        content = None
+        if result.reached_cutoff and result.deleted < amount:
+            content = "Nachrichten, die älter als 14 Tage sind, wurden nicht durchsucht."
+        await ctx.respond(content, embed=self.embeds.clear.clear_embed(result.deleted, ctx.guild.icon.url), ephemeral=True)
 
     @slash_command(name="clear_all", description="Löscht alle Nachrichten")
     @has_permissions(manage_messages=True)
     async def clear_all(self, ctx: discord.ApplicationContext):
-        await ctx.defer()
+        # Ephemeral, otherwise the progress message would be deleted by the purge itself
+        await ctx.defer(ephemeral=True)
 
         if self.config.DEV_MODE:
             await ctx.respond("Dieser Befehl ist nur für den DEV_MODUS", ephemeral=True)
             return
 
+        async def progress(state: PurgeProgress) -> None:
+            await ctx.edit(content=state.text())
 
-        total_deleted = 0
+        with rest_feature("purge"):
+            result = await PurgeEngine().purge_channels(ctx.guild.text_channels, lambda m: not m.pinned, progress)
 
-        for channel in ctx.guild.text_channels:
-            try:
-                deleted = await channel.purge(check=lambda m: not m.pinned)
-                total_deleted += len(deleted)
-            except discord.Forbidden as e:
-                await ctx.respond(f"Es ist ein Fehler aufgetreten : {e}")
-
-        await ctx.respond(embed=EmbedClear().clear_all_embed(total_deleted, ctx.guild.icon.url), ephemeral=True)
+        content = None
+        if result.errors:
+            content = "Es ist ein Fehler aufgetreten : " + ", ".join(f"{name}: {error}" for name, error in result.errors.items())
+        await ctx.edit(content=content[:2000] if content else None, embed=self.embeds.clear.clear_all_embed(result.deleted, ctx.guild.icon.url))
 
     @slash_command(name="add_users", description="Fügt alle Mitglieder zur Datenbank hinzu")
     @has_permissions(administrator=True)
     async def add_users(self, ctx: discord.ApplicationContext):
-        await ctx.defer()
-
-        for member in ctx.guild.members:
-            if member.bot:
-                continue
-            await self.database.add_user(member.id, member.name, member.discriminator)
+        await ctx.defer(ephemeral=True)
+
+        members = [(member.id, member.name, member.discriminator) for member in ctx.guild.members if not member.bot]
+        last_update = 0.0
+
+        async def progress(done: int, total: int) -> None:
+            nonlocal last_update
+            now = time.monotonic()
+            if done < total and now - last_update < 2:
+                return
+            last_update = now
+            await ctx.edit(content=f"⏳ Synchronisiere Mitglieder... {done}/{total}")
+
+        try:
+            result = await self.database.sync_users(members, progress)
+        except aiosqlite.Error as e:
+            await ctx.edit(content=f"Es ist ein Fehler aufgetreten : {e}")
+            return
 
-        await ctx.respond("Alle Mitglieder wurden zur Datenbank hinzugefügt", ephemeral=True)
+        await ctx.edit(content=(
+            f"✅ Alle Mitglieder wurden mit der Datenbank synchronisiert\n"
+            f"Hinzugefügt: {result['inserted']} | Aktualisiert: {result['updated']} | "
+            f"Entfernt: {result['deleted']} | Unverändert: {result['unchanged']}"
+        ))
 
     @clear.error
     async def clear_error(self, ctx: discord.ApplicationContext, error):
 
-        embed = EmbedClear().clear_error_embed(error, ctx.guild.icon.url)
+        embed = self.embeds.clear.clear_error_embed(error, ctx.guild.icon.url)
 
         file = "error_log.txt"
         with open(file, "w", encoding="utf-8") as f:
@@ -73,7 +109,7 @@ class Moderation(commands.Cog):
 
     @clear_all.error
     async def clear_all_error(self, ctx: discord.ApplicationContext, error):
-        embed = EmbedClear().clear_error_embed(error, ctx.guild.icon.url)
+        embed = self.embeds.clear.clear_error_embed(error, ctx.guild.icon.url)
 
         file = "error_log.txt"
         with open(file, "w", encoding="utf-8") as f:
@@ -2,25 +2,24 @@ import discord
 from discord import slash_command
 
 from discord.ext import commands
-from base.config import BotConfig
-from base.database import Database
-
-from base.utils.embeds.ticket_embed import EmbedTicket
 from base.utils.views.ticket_view import TicketView
+from base.utils.panel_publisher import PanelContent
 
 from base.utils.modals.ticket_modal import TicketSystemCloseModal
 
 class TicketSystem(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.config = BotConfig()
-        self.database = Database()
+        self.config = bot.services.config
+        self.database = bot.services.database
+        self.utils = bot.services.utils
+        self.embeds = bot.services.embeds
+        self.bot.panel_publisher.register("ticket", self.ticket_panel)
 
-    @commands.Cog.listener()
-    async def on_ready(self):
+    async def ticket_panel(self) -> PanelContent:
         channel = self.bot.get_channel(self.config.TICKET_CHANNEL_ID)
-        await channel.purge(limit=1)
-        await channel.send(embed=EmbedTicket().create_ticket_embed(channel.guild, channel.guild.get_role(self.config.DELTA_TEAM_ROLE_ID)), view=TicketView(self.bot))
+        embed = self.embeds.ticket.create_ticket_embed(channel.guild, channel.guild.get_role(self.config.DELTA_TEAM_ROLE_ID))
+        return PanelContent(channel, embed, self.bot.view_registry.get(TicketView))
 
     @slash_command(name="disable-ticket", description="Deaktiviere das Ticket-System")
     async def disable_ticket(self, ctx: discord.ApplicationContext):
@@ -34,11 +33,32 @@ class TicketSystem(commands.Cog):
         if not ctx.author.guild_permissions.administrator:
             return await ctx.send("Du hast keine Berechtigung, dieses Command auszuführen.")
 
-        channel = self.bot.get_channel(self.config.TICKET_CHANNEL_ID)
-        await channel.purge(limit=1)
-        await channel.send(embed=EmbedTicket().create_ticket_embed(channel.guild, channel.guild.get_role(self.config.DELTA_TEAM_ROLE_ID)), view=TicketView(self.bot))
+        await self.bot.panel_publisher.publish_registered("ticket", force=True)
         await ctx.respond("Das Ticket-System wurde erfolgreich aktiviert.", ephemeral=True, delete_after=5)
 
+    @slash_command(name="transcript", description="Sendet archivierte Ticket-Transkripte")
+    async def transcript(self, ctx: discord.ApplicationContext, ticket_id: str = None, user: discord.User = None):
+        if not self.utils.check_user_has_role(ctx.author, self.config.DELTA_TEAM_ROLE_ID):
+            return await ctx.respond("Du hast keine Berechtigung, dieses Command auszuführen.", ephemeral=True)
+
+        if ticket_id:
+            transcript = await self.database.get_transcript(ticket_id)
+            transcripts = [transcript] if transcript else []
+        elif user:
+            transcripts = await self.database.get_transcripts_by_user(user.id)
+        else:
+            return await ctx.respond("Bitte gib eine Ticket-ID oder einen Benutzer an.", ephemeral=True)
+
+        if not transcripts:
+            return await ctx.respond(embed=self.embeds.ticket.ticket_not_found(ctx.guild.icon.url), ephemeral=True)
+
+        try:
+            files = [self.bot.services.transcripts.as_file(transcript) for transcript in transcripts]
+        except FileNotFoundError:
+            return await ctx.respond(embed=self.embeds.ticket.ticket_not_found(ctx.guild.icon.url), ephemeral=True)
+
+        await ctx.respond(f"📜 {len(files)} Transkript(e) gefunden", files=files, ephemeral=True)
+
 
 def setup(bot):
     bot.add_cog(TicketSystem(bot))
\ No newline at end of file
@@ -1,24 +1,21 @@
 import discord
 
 from discord.ext import commands
-from base.config import BotConfig
-from base.database import Database
-
 from base.utils.views.verify_view import VerifyButton
-from base.utils.embeds.verify_embed import EmbedVerify
+from base.utils.panel_publisher import PanelContent
 
 class VerifySystem(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.config = BotConfig()
-        self.database = Database()
+        self.config = bot.services.config
+        self.database = bot.services.database
+        self.embeds = bot.services.embeds
+        self.bot.panel_publisher.register("verify", self.verify_panel)
 
-    @commands.Cog.listener()
-    async def on_ready(self):
+    async def verify_panel(self) -> PanelContent:
         channel = self.bot.get_channel(self.config.VERIFY_CHANNEL_ID)
         rule_channel = self.bot.get_channel(self.config.RULES_CHANNEL_ID)
-        await channel.purge(limit=1)
-        await channel.send(embed=EmbedVerify().verify_embed(rule_channel), view=VerifyButton(self.bot))
+        return PanelContent(channel, self.embeds.verify.verify_embed(rule_channel), self.bot.view_registry.get(VerifyButton))
 
 def setup(bot):
     bot.add_cog(VerifySystem(bot))
\ No newline at end of file
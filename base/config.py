@@ -1,7 +1,8 @@
 import os
 import platform
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 
@@ -9,8 +10,86 @@ class ConfigError(Exception):
     pass
 
 
+def _parse_bool(value: str) -> bool:
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise ValueError(f"'{value}' ist kein Wahrheitswert")
+
+
+# attribute: (environment key, parser, default) - a default of None marks the key as required
+CONFIG_KEYS: Dict[str, Tuple[str, Callable[[str], Any], Optional[str]]] = {
+    "SERVER_PLAYERS_URL": ("SERVER_PLAYERS_URL", str, None),
+    "SERVER_INFO_URL": ("SERVER_INFO_URL", str, None),
+    "SERVER_CONFIG": ("SERVER_CONFIG_PATH", str, None),
+    "DATABASE": ("DATABASE_PATH", str, None),
+    "DATABASE_WRITE_BEHIND": ("DATABASE_WRITE_BEHIND", _parse_bool, "False"),
+    "DATABASE_FLUSH_INTERVAL_MS": ("DATABASE_FLUSH_INTERVAL_MS", int, "50"),
+    "DATABASE_FLUSH_MAX_OPS": ("DATABASE_FLUSH_MAX_OPS", int, "100"),
+    "TICKET_REASONS_PATH": ("TICKET_REASONS_PATH", str, None),
+    "TICKET_CHANNEL_POOL_SIZE": ("TICKET_CHANNEL_POOL_SIZE", int, "0"),
+    "METRICS_PORT": ("METRICS_PORT", int, "0"),
+    "ASSETS_PATH": ("ASSETS_PATH", str, None),
+    "DATA_PATH": ("DATA_PATH", str, None),
+    "CHANGELOG_PATH": ("CHANGELOG_PATH", str, None),
+    "WELCOME_CHANNEL_ID": ("WELCOME_CHANNEL_ID", int, None),
+    "SERVER_STATUS_CHANNEL_ID": ("SERVER_STATUS_CHANNEL_ID", int, None),
+    "SERVER_RESTART_CHANNEL_ID": ("SERVER_RESTART_CHANNEL_ID", int, None),
+    "SERVER_MEMBERS_CHANNEL_ID": ("SERVER_TOTAL_MEMBERS_CHANNEL_ID", int, None),
+    "VERIFY_CHANNEL_ID": ("VERIFY_CHANNEL_ID", int, None),
+    "RULES_CHANNEL_ID": ("RULES_CHANNEL_ID", int, None),
+    "TICKET_CHANNEL_ID": ("TICKET_CHANNEL_ID", int, None),
+    "ID_CHANNEL_ID": ("ID_CHANNEL_ID", int, None),
+    "SUPPORT_WAITING_CHANNEL_ID": ("SUPPORT_WAITING_CHANNEL_ID", int, None),
+    "INFO_CHANNEL_ID": ("INFO_CHANNEL_ID", int, None),
+    "DELTA_TEAM_ROLE_ID": ("DELTA_TEAM_ROLE_ID", int, None),
+    "EINWOHNER_ROLE_ID": ("EINWOHNER_ROLE_ID", int, None),
+}
+
+
+class ConfigSnapshot:
+    __slots__ = ("TOKEN", *CONFIG_KEYS)
+
+    def __init__(self, values: Dict[str, Any]):
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("ConfigSnapshot ist unveränderlich")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError("ConfigSnapshot ist unveränderlich")
+
+    @classmethod
+    def from_env(cls, dev_mode: bool) -> "ConfigSnapshot":
+        values: Dict[str, Any] = {}
+        errors: List[str] = []
+
+        token_key = "DRP_DEVELOPER_BOT_TOKEN" if dev_mode else "DISCORD_BOT_TOKEN"
+        values["TOKEN"] = os.getenv(token_key)
+        if not values["TOKEN"]:
+            errors.append(f"'{token_key}' fehlt")
+
+        for attribute, (key, parser, default) in CONFIG_KEYS.items():
+            raw = os.getenv(key) or default
+            if raw is None:
+                errors.append(f"'{key}' fehlt")
+                continue
+            try:
+                values[attribute] = parser(raw)
+            except ValueError:
+                errors.append(f"'{key}' ist ungültig: {raw!r}")
+
+        if errors:
+            raise ConfigError(f"Die Konfiguration ist unvollständig: {', '.join(errors)}")
+        return cls(values)
+
+
 class BotConfigHandler:
     _instance: Optional["BotConfigHandler"] = None
+    _snapshot: Optional[ConfigSnapshot] = None
+    _reload_lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs) -> "BotConfigHandler":
         if cls._instance is None:
@@ -18,6 +97,10 @@ class BotConfigHandler:
         return cls._instance
 
     def __init__(self, dev_mode=False):
+        # The snapshot is built once, later instantiations only hand out the shared handler
+        if BotConfigHandler._snapshot is not None:
+            return
+
         self.DEV_MODE = dev_mode
 
         if self.DEV_MODE is True:
@@ -25,121 +108,146 @@ class BotConfigHandler:
                 exit("❌ Development mode is not supported on Linux.")
 
         self.load_dotenvs()
+        BotConfigHandler._snapshot = ConfigSnapshot.from_env(self.DEV_MODE)
 
     @staticmethod
-    def load_dotenv_file(path: Path) -> None:
-        if not load_dotenv(path):
+    def load_dotenv_file(path: Path, override: bool = False) -> None:
+        if not load_dotenv(path, override=override):
             raise FileNotFoundError(f"Fehler beim Laden der Konfigurationsdatei: {path}")
 
-    def load_dotenvs(self) -> None:
+    def load_dotenvs(self, override: bool = False) -> None:
         base_dir = Path(__file__).parent / "resources"
 
         try:
             if self.DEV_MODE:
-                self.load_dotenv_file(base_dir / "dev_config.env")
+                self.load_dotenv_file(base_dir / "dev_config.env", override)
                 os.environ["DEV_MODE"] = "True"
             else:
-                self.load_dotenv_file(base_dir / "config.env")
+                self.load_dotenv_file(base_dir / "config.env", override)
                 os.environ["DEV_MODE"] = "False"
 
-            self.load_dotenv_file(base_dir / "token.env")
+            self.load_dotenv_file(base_dir / "token.env", override)
 
         except FileNotFoundError:
             raise ConfigError("Konfigurationsdatei nicht gefunden")
 
+    def reload(self) -> ConfigSnapshot:
+        with self._reload_lock:
+            self.load_dotenvs(override=True)
+            # Raises before the swap, an invalid file leaves the running snapshot untouched
+            snapshot = ConfigSnapshot.from_env(self.DEV_MODE)
+            BotConfigHandler._snapshot = snapshot
+        return snapshot
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        return BotConfigHandler._snapshot
+
+
 class BotConfig(BotConfigHandler):
     def __init__(self):
         super().__init__()
 
     @property
     def TOKEN(self) -> str:
-        if self.DEV_MODE:
-            return self._get_env_var("DRP_DEVELOPER_BOT_TOKEN")
-        return self._get_env_var("DISCORD_BOT_TOKEN")
+        return self.snapshot.TOKEN
 
     @property
     def SERVER_PLAYERS_URL(self) -> str:
-        return self._get_env_var("SERVER_PLAYERS_URL")
+        return self.snapshot.SERVER_PLAYERS_URL
 
     @property
     def SERVER_INFO_URL(self) -> str:
-        return self._get_env_var("SERVER_INFO_URL")
+        return self.snapshot.SERVER_INFO_URL
 
     @property
-    def SERVER_CONFIG(self):
-        return self._get_env_var("SERVER_CONFIG_PATH")
+    def SERVER_CONFIG(self) -> str:
+        return self.snapshot.SERVER_CONFIG
 
     @property
     def DATABASE(self) -> str:
-        return self._get_env_var("DATABASE_PATH")
+        return self.snapshot.DATABASE
+
+    @property
+    def DATABASE_WRITE_BEHIND(self) -> bool:
+        return self.snapshot.DATABASE_WRITE_BEHIND
+
+    @property
+    def DATABASE_FLUSH_INTERVAL_MS(self) -> int:
+        return self.snapshot.DATABASE_FLUSH_INTERVAL_MS
+
+    @property
+    def DATABASE_FLUSH_MAX_OPS(self) -> int:
+        return self.snapshot.DATABASE_FLUSH_MAX_OPS
 
     @property
     def TICKET_REASONS_PATH(self) -> str:
-        return self._get_env_var("TICKET_REASONS_PATH")
+        return self.snapshot.TICKET_REASONS_PATH
+
+    @property
+    def TICKET_CHANNEL_POOL_SIZE(self) -> int:
+        return self.snapshot.TICKET_CHANNEL_POOL_SIZE
+
+    @property
+    def METRICS_PORT(self) -> int:
+        return self.snapshot.METRICS_PORT
 
     @property
     def ASSETS_PATH(self) -> str:
-        return self._get_env_var("ASSETS_PATH")
+        return self.snapshot.ASSETS_PATH
 
     @property
     def DATA_PATH(self) -> str:
-        return self._get_env_var("DATA_PATH")
+        return self.snapshot.DATA_PATH
 
     @property
     def CHANGELOG_PATH(self) -> str:
-        return self._get_env_var("CHANGELOG_PATH")
+        return self.snapshot.CHANGELOG_PATH
 
     @property
     def WELCOME_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("WELCOME_CHANNEL_ID"))
+        return self.snapshot.WELCOME_CHANNEL_ID
 
     @property
     def SERVER_STATUS_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("SERVER_STATUS_CHANNEL_ID"))
+        return self.snapshot.SERVER_STATUS_CHANNEL_ID
 
     @property
     def SERVER_RESTART_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("SERVER_RESTART_CHANNEL_ID"))
+        return self.snapshot.SERVER_RESTART_CHANNEL_ID
 
     @property
     def SERVER_MEMBERS_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("SERVER_TOTAL_MEMBERS_CHANNEL_ID"))
+        return self.snapshot.SERVER_MEMBERS_CHANNEL_ID
 
     @property
     def VERIFY_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("VERIFY_CHANNEL_ID"))
+        return self.snapshot.VERIFY_CHANNEL_ID
 
     @property
     def RULES_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("RULES_CHANNEL_ID"))
+        return self.snapshot.RULES_CHANNEL_ID
 
     @property
     def TICKET_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("TICKET_CHANNEL_ID"))
+        return self.snapshot.TICKET_CHANNEL_ID
 
     @property
     def ID_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("ID_CHANNEL_ID"))
+        return self.snapshot.ID_CHANNEL_ID
 
     @property
     def SUPPORT_WAITING_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("SUPPORT_WAITING_CHANNEL_ID"))
+        return self.snapshot.SUPPORT_WAITING_CHANNEL_ID
 
     @property
     def INFO_CHANNEL_ID(self) -> int:
-        return int(self._get_env_var("INFO_CHANNEL_ID"))
+        return self.snapshot.INFO_CHANNEL_ID
 
     @property
     def DELTA_TEAM_ROLE_ID(self) -> int:
-        return int(self._get_env_var("DELTA_TEAM_ROLE_ID"))
+        return self.snapshot.DELTA_TEAM_ROLE_ID
 
     @property
     def EINWOHNER_ROLE_ID(self) -> int:
-        return int(self._get_env_var("EINWOHNER_ROLE_ID"))
-
-    @staticmethod
-    def _get_env_var(key: str) -> str:
-        value = os.getenv(key)
-        if not value:
-            raise ConfigError(f"Die Umgebungsvariable '{key}' konnte nicht geladen werden")
-        return value
\ No newline at end of file
+        return self.snapshot.EINWOHNER_ROLE_ID
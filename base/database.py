@@ -1,100 +1,310 @@
 import asyncio
 import datetime
 import os
+import time
 from datetime import timedelta
 
 import aiosqlite
-from typing import List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 from base.logger import Logger
 from base.config import BotConfig
+from base.cache import MISSING, DatabaseCache
+from base.migrations import UNIX_NOW, apply_migrations, check_query_plans
+from base.utils.metrics import MetricsRegistry
+
+
+class ConnectionPool:
+    READER_CONNECTIONS = 4
+    CACHE_SIZE_KIB = 8192
+    CACHED_STATEMENTS = 256
+    BUSY_TIMEOUT_MS = 5000
+
+    def __init__(self, db: str, readers: int = READER_CONNECTIONS) -> None:
+        self.logger = Logger(__name__).get_logger()
+        self.db = db
+        self.reader_count = readers
+        self.writer: Optional[aiosqlite.Connection] = None
+        self.readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.writer is not None
+
+    async def _connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(self.db, cached_statements=self.CACHED_STATEMENTS)
+        await connection.execute("PRAGMA journal_mode=WAL")
+        await connection.execute("PRAGMA synchronous=NORMAL")
+        await connection.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KIB}")
+        await connection.execute("PRAGMA temp_store=MEMORY")
+        await connection.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        if read_only:
+            await connection.execute("PRAGMA query_only=ON")
+        return connection
+
+    async def open(self) -> None:
+        if self.is_open:
+            return
+
+        async with self._open_lock:
+            if self.is_open:
+                return
+
+            # The writer has to exist first so WAL mode is active before readers attach
+            writer = await self._connect()
+            self.readers = [await self._connect(read_only=True) for _ in range(self.reader_count)]
+            self._idle_readers = asyncio.Queue()
+            for reader in self.readers:
+                self._idle_readers.put_nowait(reader)
+            self.writer = writer
+            self.logger.debug(f"Opened connection pool (1 writer, {self.reader_count} readers) for {self.db}")
+
+    @asynccontextmanager
+    async def reader(self):
+        await self.open()
+        connection = await self._idle_readers.get()
+        try:
+            yield connection
+        finally:
+            self._idle_readers.put_nowait(connection)
+
+    @asynccontextmanager
+    async def writer_connection(self):
+        await self.open()
+        async with self._write_lock:
+            try:
+                yield self.writer
+            finally:
+                # Never leak a half-finished transaction to the next writer
+                if self.writer.in_transaction:
+                    await self.writer.rollback()
+
+    async def close(self) -> None:
+        async with self._open_lock:
+            if not self.is_open:
+                return
+
+            async with self._write_lock:
+                for _ in range(self.reader_count):
+                    reader = await self._idle_readers.get()
+                    await reader.close()
+                await self.writer.close()
+
+            self.writer = None
+            self.readers = []
+            self._idle_readers = None
+            self.logger.debug(f"Closed connection pool for {self.db}")
+
+
+class WriteBehindQueue:
+    FLUSH_INTERVAL_MS = 50
+    MAX_BATCH = 100
+
+    def __init__(self, pool: ConnectionPool, flush_interval_ms: int = FLUSH_INTERVAL_MS,
+                 max_batch: int = MAX_BATCH) -> None:
+        self.logger = Logger(__name__).get_logger()
+        self.pool = pool
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self._pending: List[Tuple[str, tuple, asyncio.Future]] = []
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def submit(self, query: str, params: tuple = ()) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, params, future))
+        self._has_pending.set()
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_pending.wait()
+            if not self._closing:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self.flush()
+            if self._closing and not self._pending:
+                return
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            if len(self._pending) < self.max_batch:
+                self._batch_full.clear()
+            if not self._pending:
+                self._has_pending.clear()
+            await self._commit_batch(batch)
+
+    async def _commit_batch(self, batch: List[Tuple[str, tuple, asyncio.Future]]) -> None:
+        errors: Dict[int, aiosqlite.Error] = {}
+        rowcounts: Dict[int, int] = {}
+        try:
+            async with self.pool.writer_connection() as connection:
+                await connection.execute("BEGIN")
+                for index, (query, params, _) in enumerate(batch):
+                    # A savepoint per write keeps one failing statement from aborting the whole batch
+                    await connection.execute("SAVEPOINT write_behind")
+                    try:
+                        cursor = await connection.execute(query, params)
+                        rowcounts[index] = cursor.rowcount
+                    except aiosqlite.Error as e:
+                        await connection.execute("ROLLBACK TO write_behind")
+                        errors[index] = e
+                    await connection.execute("RELEASE write_behind")
+                await connection.commit()
+        except aiosqlite.Error as e:
+            self.logger.error(f"Error while flushing {len(batch)} queued writes", exc_info=e)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException as e:
+            # Nobody would ever resolve these futures otherwise, the callers would wait forever
+            error = e if isinstance(e, Exception) else RuntimeError("Queued write was interrupted")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+        self.logger.debug(f"Flushed {len(batch)} queued writes ({len(errors)} failed)")
+        for index, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(rowcounts[index])
+
+    async def close(self) -> None:
+        # Cancelling would roll back a batch that is being committed, so the loop is woken and drained instead
+        self._closing = True
+        self._has_pending.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
 
 
 class DatabaseConnectionHandler:
-    def __init__(self) -> None:
+    _pools: Dict[str, ConnectionPool] = {}
+    _write_queues: Dict[str, WriteBehindQueue] = {}
+    _caches: Dict[str, DatabaseCache] = {}
+
+    def __init__(self, db: Optional[str] = None) -> None:
         self.logger = Logger(__name__).get_logger()
-        self.config = BotConfig()
-        self.db = self.config.DATABASE
-        self.connection: Optional[aiosqlite.Connection] = None
+        # An explicit path skips the bot configuration, which needs the Discord token
+        self.db = db or BotConfig().DATABASE
 
+    @property
+    def pool(self) -> ConnectionPool:
+        if self.db not in self._pools:
+            self._pools[self.db] = ConnectionPool(self.db)
+        return self._pools[self.db]
 
     async def create_database(self) -> None:
 
         if os.path.exists(self.db):
             self.logger.debug(f"Database already exists at: {self.db}")
 
-        await self.create_connection()
-        try:
-            async with self.connection.cursor() as cursor:
-                # Create users table
-                await cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS users (
-                        discord_id INTEGER UNIQUE,
-                        username TEXT NOT NULL,
-                        discriminator TEXT NOT NULL
-                    )
-                    """
-                )
-
-                await cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS tickets (
-                        uuid TEXT UNIQUE,
-                        user_id INTEGER,
-                        category TEXT NOT NULL,
-                        channel_id INTEGER,
-                        guild_id INTEGER
-                    ) 
-                    """
-                )
-
-                await cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS checkouts (
-                        user_id INTEGER,
-                        reason TEXT NOT NULL,
-                        duration TEXT NOT NULL
-                    )
-                    """
-                )
-                
-                await self.connection.commit()
-                self.logger.debug("Database created successfully")
+        async with self.get_write_connection() as connection:
+            try:
+                version = await apply_migrations(connection)
+                self.logger.debug(f"Database schema is at version {version}")
 
-        except aiosqlite.Error as e:
-            self.logger.error("Error while creating database", exc_info=e)
+                if await check_query_plans(connection):
+                    self.logger.error("Some hot queries are not served by an index")
 
-        finally:
-            await self.close_connection()
+            except aiosqlite.Error as e:
+                self.logger.error("Error while creating database", exc_info=e)
 
     @asynccontextmanager
     async def get_db_connection(self):
-        await self.create_connection()
-        try:
-            yield self.connection
-        finally:
-            await self.close_connection()
+        async with self.pool.reader() as connection:
+            yield connection
 
-    async def create_connection(self) -> None:
+    @asynccontextmanager
+    async def get_write_connection(self):
+        async with self.pool.writer_connection() as connection:
+            yield connection
+
+    @property
+    def cache(self) -> DatabaseCache:
+        if self.db not in self._caches:
+            self._caches[self.db] = DatabaseCache()
+        return self._caches[self.db]
+
+    async def warm_cache(self) -> None:
         try:
-            if self.connection is None:
-                self.connection = await aiosqlite.connect(self.db)
-                self.logger.debug(f"Connected to database {self.db}")
-            else:
-                self.logger.debug(f"Connection already exists at: {self.db}")
+            async with self.get_db_connection() as connection:
+                await self.cache.warm(connection)
+            self.logger.debug("Cache warmed")
+        except aiosqlite.Error as e:
+            self.logger.error("Error while warming cache", exc_info=e)
+
+    def register_metrics(self, registry: MetricsRegistry) -> None:
+        registry.describe("database_cache_hits_total", "counter", "Database cache lookups served from memory")
+        registry.describe("database_cache_misses_total", "counter", "Database cache lookups that went to SQLite")
+        registry.describe("database_cache_evictions_total", "counter", "Entries dropped to stay within the cache size")
+        registry.describe("database_cache_entries", "gauge", "Entries currently cached")
+        registry.add_collector(self.export_cache_metrics)
+
+    def export_cache_metrics(self, registry: MetricsRegistry) -> None:
+        for name, stats in self.cache.stats().items():
+            registry.set_total("database_cache_hits_total", stats["hits"], cache=name)
+            registry.set_total("database_cache_misses_total", stats["misses"], cache=name)
+            registry.set_total("database_cache_evictions_total", stats["evictions"], cache=name)
+            registry.set("database_cache_entries", stats["size"], cache=name)
+
+    @property
+    def write_queue(self) -> Optional[WriteBehindQueue]:
+        return self._write_queues.get(self.db)
+
+    def enable_write_behind(self, flush_interval_ms: int = WriteBehindQueue.FLUSH_INTERVAL_MS,
+                            max_batch: int = WriteBehindQueue.MAX_BATCH) -> None:
+        if self.db not in self._write_queues:
+            self._write_queues[self.db] = WriteBehindQueue(self.pool, flush_interval_ms, max_batch)
+            self.logger.debug(f"Write-behind enabled ({flush_interval_ms} ms / {max_batch} ops)")
+
+    def submit_write(self, query: str, params: tuple = ()) -> asyncio.Future:
+        # Resolves with the row count once the write is committed; without write-behind it is committed right away
+        if self.write_queue is not None:
+            return self.write_queue.submit(query, params)
+        return asyncio.ensure_future(self._write_now(query, params))
+
+    async def execute_write(self, query: str, params: tuple = ()) -> int:
+        return await self.submit_write(query, params)
+
+    async def _write_now(self, query: str, params: tuple) -> int:
+        async with self.get_write_connection() as connection:
+            cursor = await connection.execute(query, params)
+            await connection.commit()
+            return cursor.rowcount
+
+    async def open_connections(self) -> None:
+        try:
+            await self.pool.open()
         except aiosqlite.Error as e:
             self.logger.error("Error while connecting to database", exc_info=e)
 
-    async def close_connection(self) -> None:
+    async def close_connections(self) -> None:
         try:
-            if self.connection:
-                await self.connection.close()
-                self.logger.debug(f"Closed connection to database: {self.db}")
-                self.connection = None
-            else:
-                self.logger.debug(f"No connection to close: {self.db}")
+            write_queue = self._write_queues.pop(self.db, None)
+            if write_queue is not None:
+                await write_queue.close()
+            await self.pool.close()
         except aiosqlite.Error as e:
             self.logger.error("Error closing connection", exc_info=e)
 
@@ -122,7 +332,7 @@ class DatabaseConnectionHandler:
         backup_file = f"{self.db}.backup"
         try:
             self.logger.debug(f"Backing up database to {backup_file}")
-            async with aiosqlite.connect(self.db) as source_conn:
+            async with self.get_write_connection() as source_conn:
                 async with aiosqlite.connect(backup_file) as backup_conn:
                     await source_conn.backup(backup_conn)
             self.logger.debug("Database backup successful")
@@ -130,25 +340,25 @@ class DatabaseConnectionHandler:
             self.logger.error("Error while backing up database", exc_info=e)
 
 class Database(DatabaseConnectionHandler):
-    def __init__(self) -> None:
-        super().__init__()
+    SYNC_CHUNK_SIZE = 500
+
+    def __init__(self, db: Optional[str] = None) -> None:
+        super().__init__(db)
         self.db_logger = Logger("Database").get_logger()
 
     async def add_user(self, discord_id: int, username: str, discriminator: str) -> None:
-        async with self.get_db_connection() as connection:
-            async with connection.cursor() as cursor:
-                try:
-                    await cursor.execute(
-                        """
-                        INSERT INTO users (discord_id, username, discriminator)
-                        VALUES (?, ?, ?)
-                        """,
-                        (discord_id, username, discriminator)
-                    )
-                    await connection.commit()
-                    self.db_logger.debug(f"User {username} added to database")
-                except aiosqlite.Error as e:
-                    self.db_logger.error("Error adding user to database", exc_info=e)
+        try:
+            await self.execute_write(
+                """
+                INSERT INTO users (discord_id, username, discriminator)
+                VALUES (?, ?, ?)
+                """,
+                (discord_id, username, discriminator)
+            )
+            self.cache.set_user(discord_id, True)
+            self.db_logger.debug(f"User {username} added to database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error adding user to database", exc_info=e)
 
     async def get_user(self, discord_id: int) -> Optional[Tuple[int, str, str]]:
         async with self.get_db_connection() as connection:
@@ -167,6 +377,11 @@ class Database(DatabaseConnectionHandler):
                     return None
 
     async def check_user(self, discord_id: int) -> bool:
+        verified = self.cache.users.get(discord_id)
+        if verified is not MISSING:
+            return verified
+
+        generation = self.cache.generation
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
@@ -177,6 +392,8 @@ class Database(DatabaseConnectionHandler):
                         (discord_id,)
                     )
                     user = await cursor.fetchone()
+                    if generation == self.cache.generation:
+                        self.cache.users.set(discord_id, user is not None)
                     return True if user else False
                 except aiosqlite.Error as e:
                     self.db_logger.error("Error checking user in database", exc_info=e)
@@ -184,35 +401,71 @@ class Database(DatabaseConnectionHandler):
 
 
     async def remove_user(self, discord_id: int) -> None:
+        try:
+            await self.execute_write(
+                """
+                DELETE FROM users WHERE discord_id = ?
+                """,
+                (discord_id,)
+            )
+            self.cache.set_user(discord_id, False)
+            self.db_logger.debug(f"User {discord_id} removed from database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error removing user from database", exc_info=e)
+
+    async def sync_users(self, members: Iterable[Tuple[int, str, str]],
+                         progress: Optional[Callable[[int, int], Awaitable[None]]] = None) -> Dict[str, int]:
+        wanted = {discord_id: (username, discriminator) for discord_id, username, discriminator in members}
+
         async with self.get_db_connection() as connection:
-            async with connection.cursor() as cursor:
-                try:
-                    await cursor.execute(
-                        """
-                        DELETE FROM users WHERE discord_id = ?
-                        """,
-                        (discord_id,)
-                    )
+            async with connection.execute("SELECT discord_id, username, discriminator FROM users") as cursor:
+                existing = {row[0]: (row[1], row[2]) for row in await cursor.fetchall()}
+
+        inserts = [(discord_id, *values) for discord_id, values in wanted.items() if discord_id not in existing]
+        updates = [(*values, discord_id) for discord_id, values in wanted.items()
+                   if discord_id in existing and existing[discord_id] != values]
+        deletes = [(discord_id,) for discord_id in existing if discord_id not in wanted]
+
+        batches = [
+            ("INSERT INTO users (discord_id, username, discriminator) VALUES (?, ?, ?)", inserts),
+            ("UPDATE users SET username = ?, discriminator = ? WHERE discord_id = ?", updates),
+            ("DELETE FROM users WHERE discord_id = ?", deletes),
+        ]
+        total = len(inserts) + len(updates) + len(deletes)
+        done = 0
+
+        for query, rows in batches:
+            for start in range(0, len(rows), self.SYNC_CHUNK_SIZE):
+                chunk = rows[start:start + self.SYNC_CHUNK_SIZE]
+                async with self.get_write_connection() as connection:
+                    await connection.executemany(query, chunk)
                     await connection.commit()
-                    self.db_logger.debug(f"User {discord_id} removed from database")
-                except aiosqlite.Error as e:
-                    self.db_logger.error("Error removing user from database", exc_info=e)
+                self.cache.invalidate_users()
+                done += len(chunk)
+                if progress:
+                    await progress(done, total)
+
+        self.db_logger.debug(f"Synced users: {len(inserts)} added, {len(updates)} updated, {len(deletes)} removed")
+        return {
+            "inserted": len(inserts),
+            "updated": len(updates),
+            "deleted": len(deletes),
+            "unchanged": len(wanted) - len(inserts) - len(updates),
+        }
 
     async def add_ticket(self, uuid: str, user_id: int, category: str, channel_id: int, guild_id: int) -> None:
-        async with self.get_db_connection() as connection:
-            async with connection.cursor() as cursor:
-                try:
-                    await cursor.execute(
-                        """
-                        INSERT INTO tickets (uuid, user_id, category, channel_id, guild_id)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (uuid, user_id, category, channel_id, guild_id)
-                    )
-                    await connection.commit()
-                    self.db_logger.debug(f"Ticket {uuid} added to database")
-                except aiosqlite.Error as e:
-                    self.db_logger.error("Error adding ticket to database", exc_info=e)
+        try:
+            await self.execute_write(
+                """
+                INSERT INTO tickets (uuid, user_id, category, channel_id, guild_id)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (uuid, user_id, category, channel_id, guild_id)
+            )
+            self.cache.invalidate_ticket(user_id=user_id, channel_id=channel_id)
+            self.db_logger.debug(f"Ticket {uuid} added to database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error adding ticket to database", exc_info=e)
 
     async def get_ticket(self, uuid: str) -> Optional[Tuple[str, int, str, int, int]]:
         async with self.get_db_connection() as connection:
@@ -247,21 +500,24 @@ class Database(DatabaseConnectionHandler):
                     return False
 
     async def remove_ticket(self, uuid: str) -> None:
-        async with self.get_db_connection() as connection:
-            async with connection.cursor() as cursor:
-                try:
-                    await cursor.execute(
-                        """
-                        DELETE FROM tickets WHERE uuid = ?
-                        """,
-                        (uuid,)
-                    )
-                    await connection.commit()
-                    self.db_logger.debug(f"Ticket {uuid} removed from database")
-                except aiosqlite.Error as e:
-                    self.db_logger.error("Error removing ticket from database", exc_info=e)
+        try:
+            await self.execute_write(
+                """
+                DELETE FROM tickets WHERE uuid = ?
+                """,
+                (uuid,)
+            )
+            self.cache.invalidate_ticket(uuid=uuid)
+            self.db_logger.debug(f"Ticket {uuid} removed from database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error removing ticket from database", exc_info=e)
 
     async def get_tickets(self, user_id: int) -> List[Tuple[str, int, str, int, int]]:
+        tickets = self.cache.tickets_by_user.get(user_id)
+        if tickets is not MISSING:
+            return list(tickets)
+
+        generation = self.cache.generation
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
@@ -272,6 +528,8 @@ class Database(DatabaseConnectionHandler):
                         (user_id,)
                     )
                     tickets = await cursor.fetchall()
+                    if generation == self.cache.generation:
+                        self.cache.tickets_by_user.set(user_id, list(tickets))
                     return tickets
                 except aiosqlite.Error as e:
                     self.db_logger.error("Error getting tickets from database", exc_info=e)
@@ -310,6 +568,11 @@ class Database(DatabaseConnectionHandler):
                     return []
 
     async def get_ticket_by_channel_id(self, channel_id: int) -> Optional[Tuple[str, int, str, int, int]]:
+        ticket = self.cache.tickets_by_channel.get(channel_id)
+        if ticket is not MISSING:
+            return ticket
+
+        generation = self.cache.generation
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
@@ -320,28 +583,29 @@ class Database(DatabaseConnectionHandler):
                         (channel_id,)
                     )
                     ticket = await cursor.fetchone()
+                    if generation == self.cache.generation:
+                        self.cache.tickets_by_channel.set(channel_id, ticket)
                     return ticket
                 except aiosqlite.Error as e:
                     self.db_logger.error("Error getting ticket from database", exc_info=e)
                     return None
 
-    async def add_checkout(self, user_id: int, reason: str, duration: datetime.datetime):
-        async with self.get_db_connection() as connection:
-            async with connection.cursor() as cursor:
-                try:
-                    await cursor.execute(
-                        """
-                        INSERT INTO checkouts (user_id, reason, duration)
-                        VALUES (?, ?, ?)
-                        """,
-                        (user_id, reason, duration)
-                    )
-                    await connection.commit()
-                    self.db_logger.debug(f"Checkout {user_id} added to database")
-                except aiosqlite.Error as e:
-                    self.db_logger.error("Error adding checkout to database", exc_info=e)
+    async def add_checkout(self, user_id: int, reason: str, duration: str, expires_at: int):
+        try:
+            await self.execute_write(
+                """
+                INSERT INTO checkouts (user_id, reason, duration, expires_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (user_id) DO UPDATE SET reason = excluded.reason, duration = excluded.duration,
+                                                    expires_at = excluded.expires_at
+                """,
+                (user_id, reason, duration, expires_at)
+            )
+            self.db_logger.debug(f"Checkout {user_id} added to database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error adding checkout to database", exc_info=e)
 
-    async def get_checkout(self, user_id: int) -> Optional[Tuple[int, str, datetime.datetime]]:
+    async def get_checkout(self, user_id: int) -> Optional[Tuple[int, str, str, int, int]]:
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
@@ -358,46 +622,154 @@ class Database(DatabaseConnectionHandler):
                     return None
 
     async def remove_checkout(self, user_id: int) -> None:
+        try:
+            await self.execute_write(
+                """
+                DELETE FROM checkouts WHERE user_id = ?
+                """,
+                (user_id,)
+            )
+            self.db_logger.debug(f"Checkout {user_id} removed from database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error removing checkout from database", exc_info=e)
+
+    async def get_checkouts(self) -> List[Tuple[int, str, str, int, int]]:
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
                     await cursor.execute(
                         """
-                        DELETE FROM checkouts WHERE user_id = ?
-                        """,
-                        (user_id,)
+                        SELECT * FROM checkouts
+                        """
                     )
-                    await connection.commit()
-                    self.db_logger.debug(f"Checkout {user_id} removed from database")
+                    checkouts = await cursor.fetchall()
+                    return checkouts
                 except aiosqlite.Error as e:
-                    self.db_logger.error("Error removing checkout from database", exc_info=e)
+                    self.db_logger.error("Error getting checkouts from database", exc_info=e)
+                    return []
 
-    async def get_checkouts(self) -> List[Tuple[int, str, datetime.datetime]]:
+    async def get_expired_checkouts(self, now: Optional[int] = None) -> List[Tuple[int, str, str, int, int]]:
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
                     await cursor.execute(
                         """
-                        SELECT * FROM checkouts
+                        SELECT * FROM checkouts WHERE expires_at <= ?
+                        """,
+                        (int(time.time()) if now is None else now,)
+                    )
+                    expired_checkouts = await cursor.fetchall()
+                    return expired_checkouts
+                except aiosqlite.Error as e:
+                    self.db_logger.error("Error getting expired checkouts from database", exc_info=e)
+                    return []
+
+    async def get_upcoming_checkouts(self, after: int, limit: int) -> List[Tuple[int, int]]:
+        async with self.get_db_connection() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    await cursor.execute(
                         """
+                        SELECT user_id, expires_at FROM checkouts WHERE expires_at >= ? ORDER BY expires_at LIMIT ?
+                        """,
+                        (after, limit)
                     )
                     checkouts = await cursor.fetchall()
                     return checkouts
                 except aiosqlite.Error as e:
-                    self.db_logger.error("Error getting checkouts from database", exc_info=e)
+                    self.db_logger.error("Error getting upcoming checkouts from database", exc_info=e)
                     return []
 
-    async def get_expired_checkouts(self) -> List[Tuple[int, str, datetime.datetime]]:
+    async def remove_expired_checkout(self, user_id: int, expires_at: int) -> bool:
+        # Only deletes the checkout the deadline belongs to, a renewed checkout keeps its row
+        try:
+            removed = await self.execute_write(
+                """
+                DELETE FROM checkouts WHERE user_id = ? AND expires_at = ?
+                """,
+                (user_id, expires_at)
+            )
+            self.db_logger.debug(f"Expired checkout {user_id} removed from database: {bool(removed)}")
+            return removed == 1
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error removing expired checkout from database", exc_info=e)
+            return False
+
+    async def add_transcript(self, ticket_uuid: str, user_id: int, category: str, opened_at: Optional[int],
+                             closed_at: int, content_hash: str, byte_size: int, compressed_size: int,
+                             message_count: int) -> None:
+        try:
+            await self.execute_write(
+                """
+                INSERT OR REPLACE INTO transcripts (ticket_uuid, user_id, category, opened_at, closed_at,
+                                                    content_hash, byte_size, compressed_size, message_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (ticket_uuid, user_id, category, opened_at, closed_at, content_hash, byte_size, compressed_size,
+                 message_count)
+            )
+            self.db_logger.debug(f"Transcript of ticket {ticket_uuid} added to database")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error adding transcript to database", exc_info=e)
+
+    async def get_transcript(self, ticket_uuid: str) -> Optional[Tuple[str, int, str, int, int, str, int, int, int]]:
+        async with self.get_db_connection() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    await cursor.execute(
+                        """
+                        SELECT * FROM transcripts WHERE ticket_uuid = ?
+                        """,
+                        (ticket_uuid,)
+                    )
+                    transcript = await cursor.fetchone()
+                    return transcript
+                except aiosqlite.Error as e:
+                    self.db_logger.error("Error getting transcript from database", exc_info=e)
+                    return None
+
+    async def get_transcripts_by_user(self, user_id: int, limit: int = 10) -> List[Tuple[str, int, str, int, int, str, int, int, int]]:
         async with self.get_db_connection() as connection:
             async with connection.cursor() as cursor:
                 try:
                     await cursor.execute(
                         """
-                        SELECT * FROM checkouts WHERE duration <= datetime('now')
+                        SELECT * FROM transcripts WHERE user_id = ? ORDER BY closed_at DESC LIMIT ?
+                        """,
+                        (user_id, limit)
+                    )
+                    transcripts = await cursor.fetchall()
+                    return transcripts
+                except aiosqlite.Error as e:
+                    self.db_logger.error("Error getting transcripts from database", exc_info=e)
+                    return []
+
+    async def set_panel(self, name: str, channel_id: int, message_id: int, content_hash: str) -> None:
+        try:
+            await self.execute_write(
+                f"""
+                INSERT INTO panels (name, channel_id, message_id, content_hash) VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET channel_id = excluded.channel_id, message_id = excluded.message_id,
+                                                content_hash = excluded.content_hash, updated_at = {UNIX_NOW}
+                """,
+                (name, channel_id, message_id, content_hash)
+            )
+            self.db_logger.debug(f"Panel {name} stored as message {message_id}")
+        except aiosqlite.Error as e:
+            self.db_logger.error("Error storing panel in database", exc_info=e)
+
+    async def get_panel(self, name: str) -> Optional[Tuple[str, int, int, str, int]]:
+        async with self.get_db_connection() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    await cursor.execute(
                         """
+                        SELECT * FROM panels WHERE name = ?
+                        """,
+                        (name,)
                     )
-                    expired_checkouts = await cursor.fetchall()
-                    return expired_checkouts
+                    panel = await cursor.fetchone()
+                    return panel
                 except aiosqlite.Error as e:
-                    self.db_logger.error("Error getting expired checkouts from database", exc_info=e)
-                    return []
\ No newline at end of file
+                    self.db_logger.error("Error getting panel from database", exc_info=e)
+                    return None
@@ -1,14 +1,52 @@
 import os
+import queue
+import atexit
 import logging
-from typing import Dict
-from logging.handlers import RotatingFileHandler
+from typing import Dict, Optional, Set
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 class LoggerConfig:
     def __init__(self):
         self.log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'logs')
 
+class LogRouter(logging.Handler):
+    # Runs on the listener thread only, so it is the single owner of every log file handle
+    def __init__(self, log_path: str, formatter: logging.Formatter):
+        super().__init__()
+        self.log_path = log_path
+        self.formatter = formatter
+        self.file_loggers: Set[str] = set()
+        self.file_handlers: Dict[str, RotatingFileHandler] = {}
+
+        self.root_handler = RotatingFileHandler(os.path.join(log_path, f"{__name__}.log"), encoding="utf-8")
+        self.root_handler.setFormatter(formatter)
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setFormatter(formatter)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.root_handler.handle(record)
+        self.console_handler.handle(record)
+
+        if record.name in self.file_loggers:
+            self.get_file_handler(record.name).handle(record)
+
+    def get_file_handler(self, logger_name: str) -> RotatingFileHandler:
+        if logger_name not in self.file_handlers:
+            file_handler = RotatingFileHandler(os.path.join(self.log_path, f"{logger_name}.log"), encoding="utf-8")
+            file_handler.setFormatter(self.formatter)
+            self.file_handlers[logger_name] = file_handler
+        return self.file_handlers[logger_name]
+
+    def close(self) -> None:
+        for handler in [self.root_handler, self.console_handler, *self.file_handlers.values()]:
+            handler.close()
+        super().close()
+
 class Logger(LoggerConfig):
     _loggers: Dict[str, logging.Logger] = {}
+    _queue: Optional[queue.SimpleQueue] = None
+    _router: Optional[LogRouter] = None
+    _listener: Optional[QueueListener] = None
 
     def __init__(self, logger_name: str, log_level: int = logging.DEBUG, create_file_handler: bool = True):
         super().__init__()
@@ -16,35 +54,43 @@ class Logger(LoggerConfig):
         if logger_name in self._loggers:
             self.logger = self._loggers[logger_name]
         else:
+            self.start_listener(self.log_path)
+
             self.logger = logging.getLogger(logger_name)
             self.logger.setLevel(log_level)
-            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
-            os.makedirs(self.log_path, exist_ok=True)
 
             if create_file_handler:
-                file_handler = RotatingFileHandler(
-                    os.path.join(self.log_path, f"{logger_name}.log"),
-                    encoding="utf-8"
-                )
-                file_handler.setLevel(log_level)
-                file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
-
-            root_handler = RotatingFileHandler(
-                os.path.join(self.log_path, f"{__name__}.log"),
-                encoding="utf-8"
-            )
-            root_handler.setLevel(log_level)
-            root_handler.setFormatter(formatter)
-            self.logger.addHandler(root_handler)
-
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(log_level)
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+                self._router.file_loggers.add(logger_name)
+
+            queue_handler = QueueHandler(self._queue)
+            queue_handler.setLevel(log_level)
+            self.logger.addHandler(queue_handler)
 
             self._loggers[logger_name] = self.logger
 
+    @classmethod
+    def start_listener(cls, log_path: str) -> None:
+        if cls._listener is not None:
+            return
+
+        os.makedirs(log_path, exist_ok=True)
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+        cls._queue = queue.SimpleQueue()
+        cls._router = LogRouter(log_path, formatter)
+        cls._listener = QueueListener(cls._queue, cls._router)
+        cls._listener.start()
+        atexit.register(cls.stop_listener)
+
+    @classmethod
+    def stop_listener(cls) -> None:
+        if cls._listener is None:
+            return
+
+        # Drains the queue before the file handles are closed
+        cls._listener.stop()
+        cls._router.close()
+        cls._listener = None
+
     def get_logger(self) -> logging.Logger:
-        return self.logger
\ No newline at end of file
+        return self.logger
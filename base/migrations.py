@@ -0,0 +1,235 @@
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Tuple
+
+import aiosqlite
+
+from base.logger import Logger
+
+logger = Logger(__name__).get_logger()
+
+UNIX_NOW = "(CAST(strftime('%s', 'now') AS INTEGER))"
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[aiosqlite.Cursor], Awaitable[None]]
+
+
+async def initial_schema(cursor: aiosqlite.Cursor) -> None:
+    await cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            discord_id INTEGER UNIQUE,
+            username TEXT NOT NULL,
+            discriminator TEXT NOT NULL
+        )
+        """
+    )
+
+    await cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tickets (
+            uuid TEXT UNIQUE,
+            user_id INTEGER,
+            category TEXT NOT NULL,
+            channel_id INTEGER,
+            guild_id INTEGER
+        )
+        """
+    )
+
+    await cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS checkouts (
+            user_id INTEGER,
+            reason TEXT NOT NULL,
+            duration TEXT NOT NULL
+        )
+        """
+    )
+
+
+async def keys_timestamps_and_indexes(cursor: aiosqlite.Cursor) -> None:
+    # New columns are appended so the tuple positions callers rely on stay the same
+    await cursor.execute(
+        f"""
+        CREATE TABLE users_new (
+            discord_id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            discriminator TEXT NOT NULL,
+            created_at INTEGER NOT NULL DEFAULT {UNIX_NOW}
+        )
+        """
+    )
+    await cursor.execute(
+        """
+        INSERT OR IGNORE INTO users_new (discord_id, username, discriminator)
+        SELECT discord_id, username, discriminator FROM users WHERE discord_id IS NOT NULL
+        """
+    )
+    await cursor.execute("DROP TABLE users")
+    await cursor.execute("ALTER TABLE users_new RENAME TO users")
+
+    await cursor.execute(
+        f"""
+        CREATE TABLE tickets_new (
+            uuid TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            channel_id INTEGER,
+            guild_id INTEGER,
+            created_at INTEGER NOT NULL DEFAULT {UNIX_NOW}
+        )
+        """
+    )
+    await cursor.execute(
+        """
+        INSERT OR IGNORE INTO tickets_new (uuid, user_id, category, channel_id, guild_id)
+        SELECT uuid, user_id, category, channel_id, guild_id FROM tickets
+        WHERE uuid IS NOT NULL AND user_id IS NOT NULL
+        """
+    )
+    await cursor.execute("DROP TABLE tickets")
+    await cursor.execute("ALTER TABLE tickets_new RENAME TO tickets")
+
+    await cursor.execute(
+        f"""
+        CREATE TABLE checkouts_new (
+            user_id INTEGER PRIMARY KEY,
+            reason TEXT NOT NULL,
+            duration TEXT NOT NULL,
+            created_at INTEGER NOT NULL DEFAULT {UNIX_NOW}
+        )
+        """
+    )
+    # A user only ever has one active checkout, the newest row wins
+    await cursor.execute(
+        """
+        INSERT OR REPLACE INTO checkouts_new (user_id, reason, duration)
+        SELECT user_id, reason, duration FROM checkouts WHERE user_id IS NOT NULL ORDER BY rowid
+        """
+    )
+    await cursor.execute("DROP TABLE checkouts")
+    await cursor.execute("ALTER TABLE checkouts_new RENAME TO checkouts")
+
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_channel_id ON tickets (channel_id)")
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_user_id ON tickets (user_id)")
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_category ON tickets (category)")
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_guild_id ON tickets (guild_id)")
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_checkouts_duration ON checkouts (duration)")
+
+
+async def transcript_archive(cursor: aiosqlite.Cursor) -> None:
+    await cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS transcripts (
+            ticket_uuid TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            opened_at INTEGER,
+            closed_at INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            byte_size INTEGER NOT NULL,
+            compressed_size INTEGER NOT NULL,
+            message_count INTEGER NOT NULL
+        )
+        """
+    )
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_user_id ON transcripts (user_id, closed_at)")
+
+
+async def panels(cursor: aiosqlite.Cursor) -> None:
+    await cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS panels (
+            name TEXT PRIMARY KEY,
+            channel_id INTEGER NOT NULL,
+            message_id INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            updated_at INTEGER NOT NULL DEFAULT {UNIX_NOW}
+        )
+        """
+    )
+
+
+async def checkout_expiry(cursor: aiosqlite.Cursor) -> None:
+    await cursor.execute("ALTER TABLE checkouts ADD COLUMN expires_at INTEGER")
+
+    # The modal stores the last day of absence as dd/mm/yyyy, the checkout runs out when that day is over
+    await cursor.execute("SELECT user_id, duration FROM checkouts")
+    for user_id, duration in await cursor.fetchall():
+        try:
+            expires_at = int((datetime.strptime(duration, "%d/%m/%Y") + timedelta(days=1)).timestamp())
+        except ValueError:
+            logger.warning(f"Checkout of {user_id} has an invalid duration and never expires: {duration}")
+            continue
+        await cursor.execute("UPDATE checkouts SET expires_at = ? WHERE user_id = ?", (expires_at, user_id))
+
+    await cursor.execute("DROP INDEX IF EXISTS idx_checkouts_duration")
+    await cursor.execute("CREATE INDEX IF NOT EXISTS idx_checkouts_expires_at ON checkouts (expires_at)")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "initial schema", initial_schema),
+    Migration(2, "primary keys, timestamps and indexes", keys_timestamps_and_indexes),
+    Migration(3, "transcript archive index", transcript_archive),
+    Migration(4, "published panels", panels),
+    Migration(5, "checkout expiry timestamps", checkout_expiry),
+]
+
+# Every query on an interaction or scheduler path, with sample parameters for EXPLAIN QUERY PLAN
+HOT_QUERIES: Dict[str, Tuple[str, tuple]] = {
+    "get_user": ("SELECT * FROM users WHERE discord_id = ?", (0,)),
+    "get_ticket": ("SELECT * FROM tickets WHERE uuid = ?", ("",)),
+    "get_tickets": ("SELECT * FROM tickets WHERE user_id = ?", (0,)),
+    "get_tickets_by_category": ("SELECT * FROM tickets WHERE category = ?", ("",)),
+    "get_tickets_by_guild": ("SELECT * FROM tickets WHERE guild_id = ?", (0,)),
+    "get_ticket_by_channel_id": ("SELECT * FROM tickets WHERE channel_id = ?", (0,)),
+    "get_checkout": ("SELECT * FROM checkouts WHERE user_id = ?", (0,)),
+    "get_expired_checkouts": ("SELECT * FROM checkouts WHERE expires_at <= ?", (0,)),
+    "get_upcoming_checkouts": ("SELECT user_id, expires_at FROM checkouts WHERE expires_at >= ? ORDER BY expires_at LIMIT ?", (0, 1)),
+    "get_transcript": ("SELECT * FROM transcripts WHERE ticket_uuid = ?", ("",)),
+    "get_transcripts_by_user": ("SELECT * FROM transcripts WHERE user_id = ? ORDER BY closed_at DESC", (0,)),
+    "get_panel": ("SELECT * FROM panels WHERE name = ?", ("",)),
+}
+
+
+async def get_schema_version(connection: aiosqlite.Connection) -> int:
+    async with connection.execute("PRAGMA user_version") as cursor:
+        row = await cursor.fetchone()
+        return row[0]
+
+
+async def apply_migrations(connection: aiosqlite.Connection) -> int:
+    version = await get_schema_version(connection)
+
+    for migration in MIGRATIONS:
+        if migration.version <= version:
+            continue
+
+        logger.info(f"🗄️ Applying migration {migration.version}: {migration.name}")
+        await connection.execute("BEGIN")
+        try:
+            async with connection.cursor() as cursor:
+                await migration.apply(cursor)
+                await cursor.execute(f"PRAGMA user_version = {migration.version}")
+            await connection.commit()
+        except aiosqlite.Error:
+            await connection.rollback()
+            raise
+        version = migration.version
+
+    return version
+
+
+async def check_query_plans(connection: aiosqlite.Connection) -> List[str]:
+    unindexed = []
+    for name, (query, params) in HOT_QUERIES.items():
+        async with connection.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+            details = [row[3] for row in await cursor.fetchall()]
+
+        if not any(detail.startswith("SEARCH") for detail in details):
+            unindexed.append(name)
+            logger.error(f"❌ Query '{name}' does not use an index: {details}")
+    return unindexed
@@ -0,0 +1,49 @@
+from base.config import BotConfig
+from base.database import Database
+from base.utils.manager import Manager
+from base.utils.metrics import InteractionMetrics, MetricsRegistry, MetricsServer
+from base.utils.rest_metrics import RestAccounting
+from base.utils.utilities import Utilities
+from base.utils.server_poller import ServerPoller
+from base.utils.checkout_scheduler import CheckoutScheduler
+from base.utils.ticket_channel_pool import TicketChannelPool
+from base.utils.transcript import TranscriptEngine
+from base.utils.transcript_archive import TranscriptArchive
+from base.utils.embeds.clear_embed import EmbedClear
+from base.utils.embeds.event_embed import EmbedEvent
+from base.utils.embeds.ticket_embed import EmbedTicket
+from base.utils.embeds.verify_embed import EmbedVerify
+from base.utils.embeds.checkout_embed import CheckoutEmbed
+from base.utils.embeds.changelog_embed import ChangelogEmbed
+from base.utils.embeds.metrics_embed import EmbedMetrics
+
+
+class Embeds:
+    def __init__(self, utils: Utilities):
+        self.ticket = EmbedTicket()
+        self.verify = EmbedVerify()
+        self.event = EmbedEvent(utils)
+        self.clear = EmbedClear()
+        self.checkout = CheckoutEmbed()
+        self.changelog = ChangelogEmbed(utils)
+        self.metrics = EmbedMetrics()
+
+
+class Services:
+    # One instance of every shared service, handed to cogs, views and modals instead of building their own
+    def __init__(self):
+        self.config = BotConfig()
+        self.utils = Utilities(self.config)
+        self.database = Database()
+        self.embeds = Embeds(self.utils)
+        self.transcript_engine = TranscriptEngine()
+        self.transcripts = TranscriptArchive(self.config, self.database, self.transcript_engine)
+        self.metrics = MetricsRegistry()
+        self.manager = Manager(self.config, self.utils, self.metrics)
+        self.server_poller = ServerPoller(config=self.config)
+        self.ticket_pool = TicketChannelPool(self.config)
+        self.checkout_scheduler = CheckoutScheduler(self.database)
+        self.interaction_metrics = InteractionMetrics(self.metrics)
+        self.metrics_server = MetricsServer(self.metrics, self.config.METRICS_PORT)
+        self.rest_accounting = RestAccounting(self.metrics)
+        self.database.register_metrics(self.metrics)
@@ -0,0 +1,79 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import discord
+
+from base.logger import Logger
+from base.database import Database
+from base.utils.rest_metrics import rest_feature
+
+
+class CheckoutScheduler:
+    # Only the nearest deadlines are kept in memory, the rest is loaded once the heap runs past them
+    HEAP_LIMIT = 1000
+    MAX_SLEEP = 3600
+
+    def __init__(self, database: Optional[Database] = None):
+        self.database = database or Database()
+        self.logger = Logger(__name__).get_logger()
+        self.bot: Optional[discord.Bot] = None
+        self.heap: List[Tuple[int, int]] = []
+        self.horizon: Optional[int] = None
+        self._changed = asyncio.Event()
+
+    @staticmethod
+    def expires_at(duration: str) -> int:
+        # The checkout covers the whole last day, it runs out at the following midnight
+        return int((datetime.strptime(duration, "%d/%m/%Y") + timedelta(days=1)).timestamp())
+
+    async def load(self) -> None:
+        rows = await self.database.get_upcoming_checkouts(0, self.HEAP_LIMIT)
+        self.heap = [(expires_at, user_id) for user_id, expires_at in rows]
+        heapq.heapify(self.heap)
+        # None means every checkout is in memory
+        self.horizon = rows[-1][1] if len(rows) >= self.HEAP_LIMIT else None
+        self.logger.debug(f"Checkout scheduler loaded {len(rows)} deadlines")
+
+    def push(self, user_id: int, expires_at: int) -> None:
+        heapq.heappush(self.heap, (expires_at, user_id))
+        self._changed.set()
+
+    async def run(self, bot: discord.Bot) -> None:
+        self.bot = bot
+        await self.load()
+
+        while True:
+            now = int(time.time())
+            while self.heap and self.heap[0][0] <= now:
+                expires_at, user_id = heapq.heappop(self.heap)
+                await self.expire(user_id, expires_at)
+
+            if self.horizon is not None and (not self.heap or self.heap[0][0] > self.horizon):
+                await self.load()
+                continue
+
+            timeout = self.MAX_SLEEP
+            if self.heap:
+                timeout = min(timeout, self.heap[0][0] - now)
+
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+
+    async def expire(self, user_id: int, expires_at: int) -> None:
+        # A stale heap entry or a renewed checkout deletes nothing, so the user is notified exactly once
+        if not await self.database.remove_expired_checkout(user_id, expires_at):
+            return
+
+        self.logger.info(f"⌛ Checkout von {user_id} abgelaufen")
+        try:
+            with rest_feature("checkout"):
+                user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+                await user.send("Dein Checkout ist abgelaufen und wurde entfernt.")
+        except discord.HTTPException as e:
+            self.logger.warning(f"Checkout expiry of {user_id} could not be sent: {e}")
@@ -9,10 +9,14 @@ class EmbedsBase:
     ERROR_COLOR = discord.Color.from_rgb(255, 0, 0)    # Rot
     WARNING_COLOR = discord.Color.from_rgb(255, 255, 0)  # Gelb
 
-    def __init__(self):
-        # Automatisch das aktuelle Jahr setzen
-        self.year = datetime.now().year
-        self.now = datetime.now().strftime("%d.%m.%Y %H:%M")
+    # Erst beim Rendern berechnen, damit geteilte Instanzen kein veraltetes Datum liefern
+    @property
+    def year(self) -> int:
+        return datetime.now().year
+
+    @property
+    def now(self) -> str:
+        return datetime.now().strftime("%d.%m.%Y %H:%M")
 
     def set_standard_footer_and_author(self, embed: discord.Embed, icon_url: str = "") -> discord.Embed:
         if icon_url.startswith("http"):
@@ -1,13 +1,14 @@
 import discord
+from typing import Optional
 
 from base.utils.embeds.base_embed import EmbedsBase
 from base.utils.utilities import Utilities
 
 
 class ChangelogEmbed(EmbedsBase):
-    def __init__(self):
+    def __init__(self, utils: Optional[Utilities] = None):
         super().__init__()
-        self.utils = Utilities()
+        self.utils = utils or Utilities()
 
     def changelog_embed(self, icon_url: str = "") -> discord.Embed:
         embed = discord.Embed(title="Changelog", description="Die neuesten Änderungen", color=discord.Color.blurple())
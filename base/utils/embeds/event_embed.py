@@ -1,13 +1,14 @@
 import discord
+from typing import Optional
 
 from base.utils.embeds.base_embed import EmbedsBase
 from base.utils.utilities import Utilities
 
 
 class EmbedEvent(EmbedsBase):
-    def __init__(self):
-        self.utils = Utilities()
+    def __init__(self, utils: Optional[Utilities] = None):
         super().__init__()
+        self.utils = utils or Utilities()
 
     def welcome_embed(self, guild: discord.Guild, member: discord.Member, verify_channel: discord.TextChannel) -> discord.Embed:
         embed = discord.Embed(
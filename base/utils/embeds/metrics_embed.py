@@ -0,0 +1,60 @@
+import discord
+from typing import Dict, List, Tuple
+
+from base.utils.embeds.base_embed import EmbedsBase
+from base.utils.metrics import Histogram
+from base.utils.rest_metrics import RestSummary
+
+
+class EmbedMetrics(EmbedsBase):
+    # Embeds allow at most 25 fields
+    MAX_FIELDS = 25
+
+    def __init__(self):
+        super().__init__()
+
+    def metrics_embed(self, rows: List[Tuple[Dict[str, str], Histogram, float]], summaries: List[Tuple[str, str]],
+                      icon_url: str = "") -> discord.Embed:
+        embed = discord.Embed(
+            title="📈 Interaktions-Latenzen",
+            description="Bestätigungszeit der letzten Interaktionen je Befehl, Button, Dropdown und Modal",
+            color=self.MAIN_COLOR
+        )
+
+        if not rows:
+            embed.description = "Es wurden noch keine Interaktionen gemessen"
+
+        for name, value in summaries:
+            embed.add_field(name=name, value=value, inline=False)
+
+        for labels, histogram, errors in rows[:self.MAX_FIELDS - len(summaries)]:
+            embed.add_field(
+                name=f"{labels.get('type', '?')}: {labels.get('name', '?')}",
+                value=(
+                    f"Anzahl: {histogram.count} | Fehler: {int(errors)}\n"
+                    f"p50: {histogram.percentile(0.5) * 1000:.0f} ms | p99: {histogram.percentile(0.99) * 1000:.0f} ms"
+                ),
+                inline=False
+            )
+        return self.set_standard_footer_and_author(embed, icon_url)
+
+    def rest_embed(self, report: List[RestSummary], window: int, icon_url: str = "") -> discord.Embed:
+        embed = discord.Embed(
+            title="📡 REST-Aufrufe",
+            description=f"Discord-API-Aufrufe der letzten {window // 60} Minuten je Funktion",
+            color=self.MAIN_COLOR
+        )
+
+        if not report:
+            embed.description = "Es wurden noch keine REST-Aufrufe gemessen"
+
+        for summary in report[:self.MAX_FIELDS]:
+            embed.add_field(
+                name=summary.feature,
+                value=(
+                    f"Aufrufe: {summary.calls} | Dauer: {summary.seconds:.1f}s | Rate-Limits: {summary.rate_limited}\n"
+                    f"Häufigste Route: `{summary.top_route}`"
+                ),
+                inline=False
+            )
+        return self.set_standard_footer_and_author(embed, icon_url)
@@ -0,0 +1,69 @@
+import asyncio
+import json
+from typing import Any, Dict, NamedTuple, Optional
+
+import aiohttp
+
+from base.logger import Logger
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class HttpClient:
+    _instance: Optional["HttpClient"] = None
+
+    DEFAULT_TIMEOUT = 5.0
+    CONNECTION_LIMIT = 20
+    CONNECTION_LIMIT_PER_HOST = 4
+    KEEPALIVE_TIMEOUT = 30.0
+
+    def __new__(cls, *args, **kwargs) -> "HttpClient":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+            cls._instance._session = None
+            cls._instance._lock = None
+        return cls._instance
+
+    def __init__(self):
+        self.logger = Logger(__name__).get_logger()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.CONNECTION_LIMIT,
+                    limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=300,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.DEFAULT_TIMEOUT),
+                )
+                self.logger.debug("🌐 HTTP-Session erstellt")
+        return self._session
+
+    async def get(self, url: str, timeout: float = DEFAULT_TIMEOUT,
+                  headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        session = await self.get_session()
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            body = await response.read()
+            return HttpResponse(response.status, body)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            self.logger.debug("🌐 HTTP-Session geschlossen")
+        self._session = None
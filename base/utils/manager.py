@@ -1,17 +1,29 @@
 import asyncio
+from typing import Optional
+
 import discord
-from discord.errors import Forbidden, HTTPException, NotFound
 
 from base.logger import Logger
 from base.config import BotConfig
 from base.utils.utilities import Utilities
+from base.utils.metrics import MetricsRegistry
+from base.utils.rename_scheduler import ChannelRenameScheduler
+from base.utils.restart_schedule import RestartSchedule
 
 logger = Logger(__name__).get_logger()
 
 class Manager:
-    def __init__(self):
-        self.config = BotConfig()
-        self.utils = Utilities()
+    MEMBER_COUNT_DEBOUNCE = 30
+
+    def __init__(self, config: Optional[BotConfig] = None, utils: Optional[Utilities] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.config = config or BotConfig()
+        self.utils = utils or Utilities(self.config)
+        self.rename_scheduler = ChannelRenameScheduler(registry=metrics)
+        self.restart_schedule = RestartSchedule(self.config.SERVER_CONFIG)
+        self.members_channel: Optional[discord.VoiceChannel] = None
+        self.member_count: Optional[int] = None
+        self._member_count_task: Optional[asyncio.Task] = None
 
     async def server_channel_status(self, bot: discord.Bot):
         channel_status = bot.get_channel(self.config.SERVER_STATUS_CHANNEL_ID)
@@ -28,20 +40,15 @@ class Manager:
         logger.info(f"Berechtigungen für den Channel {channel_status.name} gesetzt.")
 
         last_status = None
+        snapshot = None
         while True:
-            try:
-                current_status = self.utils.check_server_status()
-
-                if current_status != last_status:
-                    logger.info(f"Server status updated to: {current_status}")
-                    await channel_status.edit(name=f"{current_status}")
-                    logger.info(f"Server status wurde erfolgreich aktualisiert.")
-                    last_status = current_status
-                await asyncio.sleep(2)
+            snapshot = await bot.server_poller.next_snapshot(snapshot)
+            current_status = snapshot.status_text
 
-            except (Forbidden, HTTPException, NotFound) as e:
-                logger.error(f"Error while editing channel: {e}")
-                await asyncio.sleep(10)
+            if current_status != last_status:
+                logger.info(f"Server status updated to: {current_status}")
+                self.rename_scheduler.request(channel_status, current_status)
+                last_status = current_status
 
     async def server_channel_restarter(self, bot: discord.Bot):
         channel_restart = bot.get_channel(self.config.SERVER_RESTART_CHANNEL_ID)
@@ -57,27 +64,22 @@ class Manager:
         await channel_restart.edit(overwrites=overwrites)
         logger.info(f"Berechtigungen für den Channel {channel_restart.name} gesetzt.")
 
-        last_restart_time = None  # Track the last restart time to avoid redundant updates
+        last_restart_time = ""  # Track the last restart time to avoid redundant updates
 
         while True:
-            try:
-                restarter = self.utils.get_restarter_schedule()
+            next_restart = self.restart_schedule.next_restart()
+            restarter = next_restart.strftime("%H:%M") if next_restart else None
 
+            if restarter != last_restart_time:
                 if restarter is None:
-                    await channel_restart.edit(name="Kein Restart geplant")
+                    self.rename_scheduler.request(channel_restart, "Kein Restart geplant")
                     logger.info("No restart scheduled")
-                    last_restart_time = None
-
-                if restarter != last_restart_time:
-                    await channel_restart.edit(name=f"Restart um {restarter} Uhr")
+                else:
+                    self.rename_scheduler.request(channel_restart, f"Restart um {restarter} Uhr")
                     logger.info(f"Restart schedule updated to: {restarter}")
-                    last_restart_time = restarter
+                last_restart_time = restarter
 
-                await asyncio.sleep(120)
-
-            except (Forbidden, HTTPException, NotFound) as e:
-                logger.error(f"Error while editing channel: {e}")
-                await asyncio.sleep(10)
+            await self.restart_schedule.wait_until_next_change(next_restart)
 
     async def server_channel_total_members(self, bot: discord.Bot):
         channel_total_members = bot.get_channel(self.config.SERVER_MEMBERS_CHANNEL_ID)
@@ -94,18 +96,29 @@ class Manager:
         await channel_total_members.edit(overwrites=overwrites)
         logger.info(f"Berechtigungen für den Channel {channel_total_members.name} gesetzt.")
 
-        last_member_count = None  # Track the last member count to avoid redundant updates
-
-        while True:
-            try:
-                current_member_count = channel_total_members.guild.member_count
-
-                if current_member_count != last_member_count:
-                    await channel_total_members.edit(name=f"Total Members: {current_member_count - 1}")
-                    logger.info(f"Total members updated to: {current_member_count}")
-                    last_member_count = current_member_count  # Update last member count
-                await asyncio.sleep(3600)
-
-            except (Forbidden, HTTPException, NotFound) as e:
-                logger.error(f"Error while editing channel: {e}")
-                await asyncio.sleep(10)  # Wait a bit before retrying to avoid spam on errors
+        self.members_channel = channel_total_members
+        self.member_count = sum(1 for member in guild.members if not member.bot)
+        logger.info(f"Total members counted: {self.member_count}")
+        self.rename_scheduler.request(channel_total_members, f"Total Members: {self.member_count}")
+
+    def member_joined(self, member: discord.Member) -> None:
+        if member.bot or self.member_count is None:
+            return
+        self.member_count += 1
+        self._schedule_member_count_update()
+
+    def member_left(self, member: discord.Member) -> None:
+        if member.bot or self.member_count is None:
+            return
+        self.member_count -= 1
+        self._schedule_member_count_update()
+
+    def _schedule_member_count_update(self) -> None:
+        if self._member_count_task is None or self._member_count_task.done():
+            self._member_count_task = asyncio.create_task(self._publish_member_count())
+
+    async def _publish_member_count(self) -> None:
+        # Collect a burst of joins/leaves into one rename, the scheduler then enforces the rename window
+        await asyncio.sleep(self.MEMBER_COUNT_DEBOUNCE)
+        self.rename_scheduler.request(self.members_channel, f"Total Members: {self.member_count}")
+        logger.info(f"Total members updated to: {self.member_count}")
@@ -0,0 +1,245 @@
+import asyncio
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import discord
+from aiohttp import web
+from discord.interactions import InteractionResponse
+from discord.state import ConnectionState
+
+from base.logger import Logger
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0)
+    # Recent observations for the percentiles in the summary, the buckets cover the whole lifetime
+    WINDOW = 1024
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: Deque[float] = deque(maxlen=self.WINDOW)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.BUCKETS, value)
+        if index < len(self.BUCKETS):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def percentile(self, q: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.descriptions: Dict[str, Tuple[str, str]] = {}
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.gauges: Dict[str, Dict[Labels, float]] = {}
+        self.histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self.collectors: List[Callable[["MetricsRegistry"], None]] = []
+
+    @staticmethod
+    def _labels(labels: Dict[str, str]) -> Labels:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def describe(self, name: str, metric_type: str, description: str) -> None:
+        self.descriptions[name] = (metric_type, description)
+
+    def inc(self, name: str, value: float = 1, /, **labels) -> None:
+        series = self.counters.setdefault(name, {})
+        key = self._labels(labels)
+        series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, /, **labels) -> None:
+        self.gauges.setdefault(name, {})[self._labels(labels)] = value
+
+    def set_total(self, name: str, value: float, /, **labels) -> None:
+        # For counters kept elsewhere, a collector copies their running total
+        self.counters.setdefault(name, {})[self._labels(labels)] = value
+
+    def add_collector(self, collector: Callable[["MetricsRegistry"], None]) -> None:
+        self.collectors.append(collector)
+
+    def collect(self) -> None:
+        for collector in self.collectors:
+            collector(self)
+
+    def observe(self, name: str, value: float, /, **labels) -> None:
+        series = self.histograms.setdefault(name, {})
+        key = self._labels(labels)
+        if key not in series:
+            series[key] = Histogram()
+        series[key].observe(value)
+
+    def series(self, name: str) -> List[Tuple[Dict[str, str], Histogram]]:
+        return [(dict(labels), histogram) for labels, histogram in self.histograms.get(name, {}).items()]
+
+    def counter(self, name: str, /, **labels) -> float:
+        return self.counters.get(name, {}).get(self._labels(labels), 0)
+
+    @staticmethod
+    def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(labels) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+        escaped = (
+            f'{key}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for key, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def render(self) -> str:
+        self.collect()
+        lines: List[str] = []
+
+        def header(name: str, default_type: str) -> None:
+            metric_type, description = self.descriptions.get(name, (default_type, name))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        for name, series in self.counters.items():
+            header(name, "counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{self._format_labels(labels)} {value}")
+
+        for name, series in self.gauges.items():
+            header(name, "gauge")
+            for labels, value in series.items():
+                lines.append(f"{name}{self._format_labels(labels)} {value}")
+
+        for name, series in self.histograms.items():
+            header(name, "histogram")
+            for labels, histogram in series.items():
+                cumulative = 0
+                for bound, count in zip(histogram.BUCKETS, histogram.bucket_counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{self._format_labels(labels, ('le', str(bound)))} {cumulative}")
+                lines.append(f"{name}_bucket{self._format_labels(labels, ('le', '+Inf'))} {histogram.count}")
+                lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class TimedInteractionResponse(InteractionResponse):
+    # py-cord flips _responded on the first response of any kind, that moment is the acknowledgement
+    __slots__ = ("_done", "_received_at", "_on_ack")
+
+    def __init__(self, parent: discord.Interaction, on_ack: Callable[[float], None]):
+        self._done = False
+        self._received_at = time.perf_counter()
+        self._on_ack = on_ack
+        super().__init__(parent)
+
+    @property
+    def _responded(self) -> bool:
+        return self._done
+
+    @_responded.setter
+    def _responded(self, value: bool) -> None:
+        if value and not self._done:
+            self._on_ack(time.perf_counter() - self._received_at)
+        self._done = value
+
+
+class InteractionMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.started: Dict[int, float] = {}
+        registry.describe("discord_interactions_total", "counter", "Received interactions")
+        registry.describe("discord_interaction_errors_total", "counter", "Interactions that raised an error")
+        registry.describe("discord_interaction_ack_seconds", "histogram", "Time until the interaction was acknowledged")
+        registry.describe("discord_interaction_duration_seconds", "histogram", "Time until a command completed")
+
+    @staticmethod
+    def labels(interaction: discord.Interaction) -> Dict[str, str]:
+        if interaction.type == discord.InteractionType.application_command:
+            return {"type": "command", "name": interaction.data.get("name", "unknown")}
+        # Labels are taken before py-cord resolves the view or modal, the custom_id is all there is
+        if interaction.type == discord.InteractionType.modal_submit:
+            return {"type": "modal", "name": interaction.custom_id or "unknown"}
+        if interaction.type == discord.InteractionType.component:
+            return {"type": "component", "name": interaction.custom_id or "unknown"}
+        return {"type": interaction.type.name, "name": "unknown"}
+
+    def track(self, interaction: discord.Interaction) -> None:
+        labels = self.labels(interaction)
+        # Component and modal callbacks run outside the command pipeline, only commands report a completion
+        if interaction.type == discord.InteractionType.application_command:
+            self.started[interaction.id] = time.perf_counter()
+        interaction._cs_response = TimedInteractionResponse(
+            interaction, lambda elapsed: self.registry.observe("discord_interaction_ack_seconds", elapsed, **labels)
+        )
+        self.registry.inc("discord_interactions_total", **labels)
+
+    def completed(self, interaction: discord.Interaction, failed: bool = False) -> None:
+        started = self.started.pop(interaction.id, None)
+        labels = self.labels(interaction)
+        if failed:
+            self.registry.inc("discord_interaction_errors_total", **labels)
+        if started is not None:
+            self.registry.observe("discord_interaction_duration_seconds", time.perf_counter() - started, **labels)
+
+
+class InteractionTrackingState(ConnectionState):
+    def __init__(self, interaction_metrics: InteractionMetrics, **options):
+        self.interaction_metrics = interaction_metrics
+        super().__init__(**options)
+
+    def parse_interaction_create(self, data) -> None:
+        # Same dispatch as py-cord, but the timed response is installed before the view and modal tasks are
+        # created, otherwise their callbacks would already hold the plain response
+        interaction = discord.Interaction(data=data, state=self)
+        self.interaction_metrics.track(interaction)
+        if data["type"] == 3:
+            custom_id = interaction.data["custom_id"]
+            component_type = interaction.data["component_type"]
+            self._view_store.dispatch(component_type, custom_id, interaction)
+        if interaction.type == discord.InteractionType.modal_submit:
+            user_id, custom_id = (
+                interaction.user.id,
+                interaction.data["custom_id"],
+            )
+            asyncio.create_task(
+                self._modal_store.dispatch(user_id, custom_id, interaction)
+            )
+
+        self.dispatch("interaction", interaction)
+
+
+class MetricsServer:
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "127.0.0.1"):
+        self.registry = registry
+        self.port = port
+        self.host = host
+        self.logger = Logger(__name__).get_logger()
+        self.runner: Optional[web.AppRunner] = None
+
+    async def handle(self, _: web.Request) -> web.Response:
+        return web.Response(text=self.registry.render(), content_type="text/plain", charset="utf-8")
+
+    async def start(self) -> None:
+        if self.runner is not None or self.port <= 0:
+            return
+
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        self.logger.info(f"📈 Metrics available at http://{self.host}:{self.port}/metrics")
+
+    async def close(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
@@ -1,16 +1,15 @@
 import discord
 from datetime import datetime
-from discord.ext import tasks
 
-from base.database import Database
-from base.utils.utilities import Utilities
-from base.utils.embeds.checkout_embed import CheckoutEmbed
+from base.services import Services
 
 class CheckoutModal(discord.ui.Modal):
-    def __init__(self):
-        self.utils = Utilities()
-        self.database = Database()
-        super().__init__(title="Checkout", timeout=None)
+    def __init__(self, services: Services):
+        self.utils = services.utils
+        self.database = services.database
+        self.checkout_scheduler = services.checkout_scheduler
+        self.embeds = services.embeds
+        super().__init__(title="Checkout", timeout=None, custom_id="checkout")
 
         self.reason = discord.ui.InputText(
             label="Warum meldest du dich ab?",
@@ -47,33 +46,10 @@ class CheckoutModal(discord.ui.Modal):
             )
             return
 
-        await self.database.add_checkout(interaction.user.id, reason, duration_str)
+        expires_at = self.checkout_scheduler.expires_at(duration_str)
+        await self.database.add_checkout(interaction.user.id, reason, duration_str, expires_at)
+        self.checkout_scheduler.push(interaction.user.id, expires_at)
 
         await interaction.response.send_message(
-            embed=CheckoutEmbed().checkout_embed(interaction.user, reason, duration_str))
+            embed=self.embeds.checkout.checkout_embed(interaction.user, reason, duration_str))
 
-
-class CheckoutManager:
-    def __init__(self, bot):
-        self.bot = bot
-        self.database = Database()
-        self.check_checkout_expiration.start()
-
-    @tasks.loop(minutes=5)
-    async def check_checkout_expiration(self):
-        expired_checkouts = await self.database.get_expired_checkouts()
-
-        for checkout in expired_checkouts:
-            user_id = checkout["user_id"]
-            await self.database.remove_checkout(user_id)
-
-            user = self.bot.get_user(user_id)
-            if user:
-                try:
-                    await user.send("Dein Checkout ist abgelaufen und wurde entfernt.")
-                except discord.HTTPException:
-                    pass
-
-    @check_checkout_expiration.before_loop
-    async def before_check_checkout_expiration(self):
-        await self.bot.wait_until_ready()
@@ -1,16 +1,16 @@
 import discord
 
-from base.config import BotConfig
-from base.database import Database
-from base.utils.embeds.ticket_embed import EmbedTicket
-from base.utils.utilities import Utilities
+from base.services import Services
+from base.utils.panel_publisher import PanelContent
 
 
 class TicketReasonModal(discord.ui.Modal):
-    def __init__(self):
-        self.utils = Utilities()
-        self.database = Database()
-        super().__init__(title="Ticket Grund", timeout=60)
+    def __init__(self, services: Services):
+        self.services = services
+        self.utils = services.utils
+        self.database = services.database
+        self.embeds = services.embeds
+        super().__init__(title="Ticket Grund", timeout=60, custom_id="ticket_reason")
 
         self.reason = discord.ui.InputText(
             label="Grund",
@@ -24,22 +24,29 @@ class TicketReasonModal(discord.ui.Modal):
         name = interaction.user.name
         reason = self.reason.value
 
-        await interaction.response.send_message(embed=EmbedTicket().ticket_closed_with_reason(interaction.guild.icon.url, reason), ephemeral=True)
-        await self.utils.dm_transcript(interaction, name)
-        await interaction.channel.delete()
+        await interaction.response.send_message(embed=self.embeds.ticket.ticket_closed_with_reason(interaction.guild.icon.url, reason), ephemeral=True)
 
+        # Rendered once, the archive stores the buffer and the DM sends it afterwards
         ticket = await self.database.get_ticket_by_channel_id(interaction.channel.id)
-        await self.database.remove_ticket(ticket[0])
+        rendered = await self.services.transcript_engine.render(interaction.channel, name)
+        await self.services.transcripts.archive(ticket, interaction.channel, name, rendered)
+        await self.services.transcript_engine.send(interaction.user.send, interaction.channel, name,
+                                                   content=f"{interaction.user.mention} wie gewünscht. Das Transkript",
+                                                   buffer=rendered[0])
+        await interaction.channel.delete()
 
-        await self.utils.save_ticket_reasons(interaction, reason, ticket)
+        if ticket is not None:
+            await self.database.remove_ticket(ticket[0])
+            await self.utils.save_ticket_reasons(interaction, reason, ticket)
 
         await self.utils.delete_last_category(interaction.channel.category)
 
 class TicketForwardModal(discord.ui.Modal):
-    def __init__(self, guild: discord.Guild):
-        super().__init__(title="Ticket Weiterleitung", timeout=60)
+    def __init__(self, services: Services, guild: discord.Guild):
+        super().__init__(title="Ticket Weiterleitung", timeout=60, custom_id="ticket_forward")
         self.guild = guild
-        self.config = BotConfig()
+        self.config = services.config
+        self.embeds = services.embeds
         self.forward = discord.ui.InputText(
             label="User-ID",
             placeholder="Bitte gebe die User-ID an, an die das Ticket weitergeleitet werden soll",
@@ -55,7 +62,7 @@ class TicketForwardModal(discord.ui.Modal):
             user_id = int(user_id)
         except ValueError:
             await interaction.response.send_message(
-                embed=EmbedTicket().invalid_user_id(user_id, interaction.guild.icon.url),
+                embed=self.embeds.ticket.invalid_user_id(user_id, interaction.guild.icon.url),
                 ephemeral=True
             )
             return
@@ -63,42 +70,43 @@ class TicketForwardModal(discord.ui.Modal):
         member = self.guild.get_member(user_id)
         if not member:
             await interaction.response.send_message(
-                embed=EmbedTicket().invalid_user_id(user_id, interaction.guild.icon.url),
+                embed=self.embeds.ticket.invalid_user_id(user_id, interaction.guild.icon.url),
                 ephemeral=True
             )
             return
 
         if member.bot:
             await interaction.response.send_message(
-                embed=EmbedTicket().invalid_user_id(user_id, interaction.guild.icon.url),
+                embed=self.embeds.ticket.invalid_user_id(user_id, interaction.guild.icon.url),
                 ephemeral=True
             )
             return
 
         if member.status == discord.Status.offline:
             await interaction.response.send_message(
-                embed=EmbedTicket().user_offline(interaction.guild.icon.url),
+                embed=self.embeds.ticket.user_offline(interaction.guild.icon.url),
                 ephemeral=True
             )
             return
 
         if member.guild.get_role(self.config.DELTA_TEAM_ROLE_ID) in member.roles:
             await interaction.response.send_message(
-                embed=EmbedTicket().no_team_role(interaction.guild.icon.url),
+                embed=self.embeds.ticket.no_team_role(interaction.guild.icon.url),
                 ephemeral=True
             )
             return
 
         await interaction.response.send_message(
-            embed=EmbedTicket().ticket_forwarded(member, interaction.guild.icon.url),
+            embed=self.embeds.ticket.ticket_forwarded(member, interaction.guild.icon.url),
             ephemeral=True
         )
 
         await interaction.channel.set_permissions(member, read_messages=True, send_messages=True, view_channel=True)
 
 class TicketRenameModal(discord.ui.Modal):
-    def __init__(self):
-        super().__init__(title="Ticket umbenennen", timeout=60)
+    def __init__(self, services: Services):
+        super().__init__(title="Ticket umbenennen", timeout=60, custom_id="ticket_rename")
+        self.embeds = services.embeds
         self.new_name = discord.ui.InputText(
             label="Neuer Name",
             placeholder="Bitte gebe den neuen Namen für das Ticket an",
@@ -109,13 +117,14 @@ class TicketRenameModal(discord.ui.Modal):
 
     async def callback(self, interaction: discord.Interaction):
         await interaction.channel.edit(name=self.new_name.value)
-        await interaction.response.send_message(embed=EmbedTicket().ticket_renamed(self.new_name.value, interaction.guild.icon.url), ephemeral=True)
+        await interaction.response.send_message(embed=self.embeds.ticket.ticket_renamed(self.new_name.value, interaction.guild.icon.url), ephemeral=True)
 
 class TicketSystemCloseModal(discord.ui.Modal):
     def __init__(self, bot: discord.Bot):
-        self.config = BotConfig()
+        self.config = bot.services.config
+        self.embeds = bot.services.embeds
         self.bot = bot
-        super().__init__(title="Ticket schließen", timeout=60)
+        super().__init__(title="Ticket schließen", timeout=60, custom_id="ticket_system_close")
 
         self.reason = discord.ui.InputText(
             label="Grund",
@@ -127,6 +136,6 @@ class TicketSystemCloseModal(discord.ui.Modal):
 
     async def callback(self, interaction: discord.Interaction):
         channel = self.bot.get_channel(self.config.TICKET_CHANNEL_ID)
-        await channel.purge(limit=1)
-        await channel.send(embed=EmbedTicket().ticket_disabled(self.reason.value, interaction.guild.icon.url))
+        embed = self.embeds.ticket.ticket_disabled(self.reason.value, interaction.guild.icon.url)
+        await self.bot.panel_publisher.publish("ticket", PanelContent(channel, embed), force=True)
         await interaction.response.send_message("Das Ticket-System wurde erfolgreich deaktiviert.", ephemeral=True)
\ No newline at end of file
@@ -0,0 +1,88 @@
+import asyncio
+import hashlib
+import json
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+
+import discord
+from discord.errors import Forbidden, HTTPException, NotFound
+
+from base.logger import Logger
+from base.database import Database
+
+
+class PanelContent(NamedTuple):
+    channel: discord.TextChannel
+    embed: discord.Embed
+    view: Optional[discord.ui.View] = None
+
+
+class PanelPublisher:
+    def __init__(self, bot: discord.Bot, database: Optional[Database] = None):
+        self.bot = bot
+        self.database = database or Database()
+        self.logger = Logger(__name__).get_logger()
+        self.renderers: Dict[str, Callable[[], Awaitable[PanelContent]]] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+
+    def register(self, name: str, render: Callable[[], Awaitable[PanelContent]]) -> None:
+        self.renderers[name] = render
+
+    @staticmethod
+    def content_hash(content: PanelContent) -> str:
+        payload = {
+            "embed": content.embed.to_dict(),
+            "components": content.view.to_components() if content.view else [],
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    async def publish_all(self) -> None:
+        results = await asyncio.gather(*(self.publish_registered(name) for name in self.renderers),
+                                       return_exceptions=True)
+        for name, result in zip(self.renderers, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ Panel {name} konnte nicht veröffentlicht werden: {result}")
+
+    async def publish_registered(self, name: str, force: bool = False) -> Optional[discord.Message]:
+        content = await self.renderers[name]()
+        return await self.publish(name, content, force)
+
+    async def publish(self, name: str, content: PanelContent, force: bool = False) -> Optional[discord.Message]:
+        lock = self.locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            content_hash = self.content_hash(content)
+            panel = await self.database.get_panel(name)
+            same_channel = panel is not None and panel[1] == content.channel.id
+
+            if same_channel and panel[3] == content_hash and not force:
+                self.logger.debug(f"Panel {name} is up to date, nothing to publish")
+                return None
+
+            message = None
+            if same_channel:
+                try:
+                    message = await content.channel.get_partial_message(panel[2]).edit(embed=content.embed,
+                                                                                        view=content.view)
+                    self.logger.info(f"📝 Panel {name} aktualisiert")
+                except NotFound:
+                    self.logger.warning(f"Panel {name} message {panel[2]} no longer exists, sending a new one")
+
+            if message is None:
+                if panel is None:
+                    # Remove the panel that was posted before its message ID was tracked
+                    await content.channel.purge(limit=1)
+                elif not same_channel:
+                    await self._delete_stale(panel)
+                message = await content.channel.send(embed=content.embed, view=content.view)
+                self.logger.info(f"📨 Panel {name} gesendet")
+
+            await self.database.set_panel(name, content.channel.id, message.id, content_hash)
+            return message
+
+    async def _delete_stale(self, panel) -> None:
+        channel = self.bot.get_channel(panel[1])
+        if channel is None:
+            return
+        try:
+            await channel.get_partial_message(panel[2]).delete()
+        except (Forbidden, NotFound, HTTPException):
+            pass
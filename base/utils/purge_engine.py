@@ -0,0 +1,185 @@
+import asyncio
+import re
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+import discord
+from discord.errors import Forbidden, HTTPException, NotFound
+
+from base.logger import Logger
+
+
+class PurgeProgress:
+    def __init__(self, channels_total: int = 0):
+        self.channels_total = channels_total
+        self.channels_done = 0
+        self.bulk_deleted = 0
+        self.single_deleted = 0
+        self.scanned = 0
+        self.reached_cutoff = False
+        self.errors: Dict[str, str] = {}
+
+    @property
+    def deleted(self) -> int:
+        return self.bulk_deleted + self.single_deleted
+
+    def text(self) -> str:
+        return (
+            f"⏳ Lösche Nachrichten... Kanäle: {self.channels_done}/{self.channels_total} | "
+            f"Gelöscht: {self.deleted} (Bulk: {self.bulk_deleted}, Einzeln: {self.single_deleted})"
+        )
+
+
+class PurgeFilter:
+    def __init__(self, author: Optional[discord.abc.User] = None, pattern: Optional[re.Pattern] = None,
+                 attachments_only: bool = False):
+        self.author = author
+        self.pattern = pattern
+        self.attachments_only = attachments_only
+
+    def __call__(self, message: discord.Message) -> bool:
+        if message.pinned:
+            return False
+        if self.author is not None and message.author.id != self.author.id:
+            return False
+        if self.attachments_only and not message.attachments:
+            return False
+        if self.pattern is not None and not self.pattern.search(message.content):
+            return False
+        return True
+
+
+class PurgeEngine:
+    BULK_LIMIT = 100
+    # Discord rejects bulk deletes of messages older than 14 days, the margin covers clock drift
+    BULK_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+    # Delete routes are limited per channel, so channels run in parallel while the worker count keeps the
+    # combined request rate below the global limit
+    WORKERS = 4
+    PROGRESS_INTERVAL = 2
+
+    def __init__(self, workers: int = WORKERS):
+        self.logger = Logger(__name__).get_logger()
+        self.workers = workers
+
+    @classmethod
+    def bulk_cutoff(cls):
+        return discord.utils.utcnow() - cls.BULK_MAX_AGE
+
+    async def purge_channels(self, channels: Iterable[discord.TextChannel],
+                             check: Callable[[discord.Message], bool],
+                             on_progress: Optional[Callable[[PurgeProgress], Awaitable[None]]] = None) -> PurgeProgress:
+        channels = list(channels)
+        progress = PurgeProgress(len(channels))
+        semaphore = asyncio.Semaphore(self.workers)
+        reporter = asyncio.create_task(self._report(progress, on_progress)) if on_progress else None
+
+        async def worker(channel: discord.TextChannel) -> None:
+            async with semaphore:
+                try:
+                    await self.purge_channel(channel, check, progress)
+                except (Forbidden, HTTPException) as e:
+                    progress.errors[channel.name] = str(e)
+                    self.logger.error(f"Purge of {channel.name} failed: {e}")
+                progress.channels_done += 1
+
+        try:
+            await asyncio.gather(*(worker(channel) for channel in channels))
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+        self.logger.info(f"🗑️ Purge finished: {progress.deleted} messages in {progress.channels_total} channels")
+        return progress
+
+    async def purge_channel(self, channel: discord.TextChannel, check: Callable[[discord.Message], bool],
+                            progress: PurgeProgress) -> None:
+        cutoff = self.bulk_cutoff()
+        batch: List[discord.Message] = []
+
+        async for message in channel.history(limit=None):
+            if not check(message):
+                continue
+            if message.created_at >= cutoff:
+                batch.append(message)
+                if len(batch) >= self.BULK_LIMIT:
+                    await self.bulk_delete(channel, batch, progress)
+                    batch = []
+                continue
+
+            # History is newest first, from here on every message is too old for a bulk delete
+            if batch:
+                await self.bulk_delete(channel, batch, progress)
+                batch = []
+            try:
+                await message.delete()
+                progress.single_deleted += 1
+            except NotFound:
+                pass
+
+        if batch:
+            await self.bulk_delete(channel, batch, progress)
+
+    async def purge_matching(self, channel: discord.TextChannel, check: Callable[[discord.Message], bool],
+                             limit: int, before: Optional[discord.abc.Snowflake] = None,
+                             after: Optional[discord.abc.Snowflake] = None) -> PurgeProgress:
+        progress = PurgeProgress(1)
+        cutoff = self.bulk_cutoff()
+        batch: List[discord.Message] = []
+        deletions: List[asyncio.Task] = []
+        matched = 0
+
+        async for message in channel.history(limit=None, before=before, after=after, oldest_first=False):
+            progress.scanned += 1
+            # Everything beyond this point could only be deleted one by one, so the scan ends here
+            if message.created_at < cutoff:
+                progress.reached_cutoff = True
+                break
+            if not check(message):
+                continue
+
+            batch.append(message)
+            matched += 1
+            if len(batch) >= self.BULK_LIMIT:
+                deletions.append(asyncio.create_task(self.bulk_delete(channel, batch, progress)))
+                batch = []
+            if matched >= limit:
+                break
+
+        if batch:
+            deletions.append(asyncio.create_task(self.bulk_delete(channel, batch, progress)))
+        await asyncio.gather(*deletions)
+
+        progress.channels_done = 1
+        self.logger.debug(f"Filtered purge in {channel.name}: {progress.deleted} deleted, {progress.scanned} scanned")
+        return progress
+
+    @classmethod
+    async def bulk_delete(cls, channel: discord.TextChannel, messages: List[discord.Message],
+                          progress: PurgeProgress) -> None:
+        # A long scan can outlast the safety margin, messages that aged past the limit since then go one by one
+        cutoff = cls.bulk_cutoff()
+        expired = [message for message in messages if message.created_at < cutoff]
+        messages = [message for message in messages if message.created_at >= cutoff]
+
+        try:
+            await channel.delete_messages(messages)
+            progress.bulk_deleted += len(messages)
+        except NotFound:
+            # Someone else removed one of them, fall back to deleting the rest one by one
+            expired = messages + expired
+
+        for message in expired:
+            try:
+                await message.delete()
+            except NotFound:
+                continue
+            progress.single_deleted += 1
+
+    async def _report(self, progress: PurgeProgress, on_progress: Callable[[PurgeProgress], Awaitable[None]]) -> None:
+        while True:
+            await asyncio.sleep(self.PROGRESS_INTERVAL)
+            try:
+                await on_progress(progress)
+            except HTTPException as e:
+                self.logger.warning(f"Purge progress could not be updated: {e}")
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+import discord
+from discord.errors import Forbidden, HTTPException, NotFound
+
+from base.logger import Logger
+from base.utils.metrics import MetricsRegistry
+from base.utils.rest_metrics import rest_feature
+
+
+class RenameWindow:
+    # Sliding window over the last renames, a new one is allowed once the oldest has left the window
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self.renames: Deque[float] = deque(maxlen=limit)
+
+    def time_until_slot(self) -> float:
+        if len(self.renames) < self.limit:
+            return 0.0
+        return max(0.0, self.renames[0] + self.period - time.monotonic())
+
+    def record(self) -> None:
+        self.renames.append(time.monotonic())
+
+
+class ChannelRenameScheduler:
+    # Discord allows roughly two renames per channel every ten minutes
+    RENAMES_PER_WINDOW = 2
+    WINDOW = 600
+    OUTCOMES = ("requested", "applied", "coalesced", "dropped", "failed")
+
+    def __init__(self, renames_per_window: int = RENAMES_PER_WINDOW, window: float = WINDOW,
+                 registry: Optional[MetricsRegistry] = None):
+        self.logger = Logger(__name__).get_logger()
+        self.registry = registry or MetricsRegistry()
+        self.registry.describe("discord_channel_renames_total", "counter", "Channel rename requests by outcome")
+        self.registry.describe("discord_channel_renames_pending", "gauge", "Channels with a rename waiting to be sent")
+        self.renames_per_window = renames_per_window
+        self.window = window
+        self.windows: Dict[int, RenameWindow] = {}
+        self.desired: Dict[int, str] = {}
+        # Name last sent per channel, channel.name only catches up once the edit has gone through
+        self.current: Dict[int, str] = {}
+        self.workers: Dict[int, asyncio.Task] = {}
+
+    def request(self, channel: discord.abc.GuildChannel, name: str) -> None:
+        self._count("requested")
+
+        if channel.id in self.desired:
+            # Last write wins, the pending name is replaced before it was ever sent
+            self._count("coalesced")
+        elif name == self.current.get(channel.id, channel.name):
+            self._count("dropped")
+            return
+
+        self.desired[channel.id] = name
+        self._update_pending()
+
+        worker = self.workers.get(channel.id)
+        if worker is None or worker.done():
+            self.workers[channel.id] = asyncio.create_task(self._run(channel))
+
+    def time_until_next_rename(self, channel_id: int) -> float:
+        window = self.windows.get(channel_id)
+        return window.time_until_slot() if window else 0.0
+
+    async def _run(self, channel: discord.abc.GuildChannel) -> None:
+        window = self.windows.setdefault(channel.id, RenameWindow(self.renames_per_window, self.window))
+
+        while channel.id in self.desired:
+            wait = window.time_until_slot()
+            if wait > 0:
+                self.logger.debug(f"Rename of {channel.id} delayed by {wait:.0f}s")
+                await asyncio.sleep(wait)
+                continue
+
+            name = self.desired.pop(channel.id)
+            self._update_pending()
+            if name == self.current.get(channel.id, channel.name):
+                self._count("dropped")
+                continue
+
+            window.record()
+            self.current[channel.id] = name
+            try:
+                with rest_feature("channel_rename"):
+                    await channel.edit(name=name)
+                self._count("applied")
+                self.logger.info(f"Channel {channel.id} renamed to: {name}")
+            except (Forbidden, HTTPException, NotFound) as e:
+                self.current.pop(channel.id, None)
+                self._count("failed")
+                self.logger.error(f"Error while editing channel: {e}")
+
+    def _count(self, outcome: str) -> None:
+        self.registry.inc("discord_channel_renames_total", outcome=outcome)
+
+    def _update_pending(self) -> None:
+        self.registry.set("discord_channel_renames_pending", len(self.desired))
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import aiohttp
+from discord.errors import HTTPException
+from discord.http import HTTPClient, Route
+
+from base.logger import Logger
+from base.utils.metrics import MetricsRegistry
+
+# Tasks inherit the value at creation, so a feature tag also covers the tasks it spawns
+current_feature: ContextVar[str] = ContextVar("rest_feature", default="other")
+_current_route: ContextVar[Optional[str]] = ContextVar("rest_route", default=None)
+
+
+@contextmanager
+def rest_feature(name: str) -> Iterator[None]:
+    token = current_feature.set(name)
+    try:
+        yield
+    finally:
+        current_feature.reset(token)
+
+
+class RestCall(NamedTuple):
+    at: float
+    feature: str
+    route: str
+    elapsed: float
+    failed: bool
+
+
+class RestRateLimit(NamedTuple):
+    at: float
+    feature: str
+    route: str
+    retry_after: float
+    scope: str
+
+
+class RestSummary(NamedTuple):
+    feature: str
+    calls: int
+    seconds: float
+    rate_limited: int
+    top_route: str
+
+
+class RestAccounting:
+    WINDOW = 300
+    REPORT_INTERVAL = 300
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.logger = Logger(__name__).get_logger()
+        self.http: Optional[HTTPClient] = None
+        self.calls: Deque[RestCall] = deque()
+        self.rate_limits: Deque[RestRateLimit] = deque()
+        self.trace = aiohttp.TraceConfig()
+        self.trace.on_request_end.append(self._on_request_end)
+        self.trace.freeze()
+
+        registry.describe("discord_rest_requests_total", "counter", "Discord REST calls per route and feature")
+        registry.describe("discord_rest_errors_total", "counter", "Discord REST calls that raised an error")
+        registry.describe("discord_rest_request_seconds", "histogram", "Discord REST call latency including rate limit waits")
+        registry.describe("discord_rest_bucket_remaining", "gauge", "Requests left in the route's rate limit bucket")
+        registry.describe("discord_rest_ratelimited_total", "counter", "Discord REST responses with status 429")
+        registry.describe("discord_rest_retry_after_seconds", "histogram", "Retry-after of rate limited REST calls")
+
+    @staticmethod
+    def route_label(route: Route) -> str:
+        # The path template keeps ids out of the labels
+        return f"{route.method} {route.path}"
+
+    def install(self, http: HTTPClient) -> None:
+        if self.http is not None:
+            return
+
+        self.http = http
+        request = http.request
+
+        async def instrumented(route: Route, **kwargs):
+            self._install_trace()
+            label = self.route_label(route)
+            token = _current_route.set(label)
+            started = time.perf_counter()
+            failed = False
+            try:
+                return await request(route, **kwargs)
+            except (HTTPException, aiohttp.ClientError, asyncio.TimeoutError):
+                failed = True
+                raise
+            finally:
+                _current_route.reset(token)
+                self.record(label, time.perf_counter() - started, failed)
+
+        http.request = instrumented
+
+    def _install_trace(self) -> None:
+        # py-cord creates its session on login and recreates it after a reconnect, so the trace is attached lazily.
+        # The trace sees every attempt, including the 429s py-cord retries internally.
+        session = getattr(self.http, "_HTTPClient__session", None)
+        if isinstance(session, aiohttp.ClientSession) and self.trace not in session.trace_configs:
+            session.trace_configs.append(self.trace)
+
+    def record(self, route: str, elapsed: float, failed: bool) -> None:
+        feature = current_feature.get()
+        self.registry.inc("discord_rest_requests_total", route=route, feature=feature)
+        self.registry.observe("discord_rest_request_seconds", elapsed, route=route, feature=feature)
+        if failed:
+            self.registry.inc("discord_rest_errors_total", route=route, feature=feature)
+        self.calls.append(RestCall(time.monotonic(), feature, route, elapsed, failed))
+        self._trim()
+
+    async def _on_request_end(self, _, __, params: aiohttp.TraceRequestEndParams) -> None:
+        route = _current_route.get()
+        if route is None:
+            return
+
+        headers = params.response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            self.registry.set("discord_rest_bucket_remaining", float(remaining), route=route)
+
+        if params.response.status != 429:
+            return
+
+        feature = current_feature.get()
+        retry_after = float(headers.get("X-RateLimit-Reset-After") or headers.get("Retry-After") or 0)
+        scope = headers.get("X-RateLimit-Scope", "user")
+        self.registry.inc("discord_rest_ratelimited_total", route=route, feature=feature, scope=scope)
+        self.registry.observe("discord_rest_retry_after_seconds", retry_after, route=route, feature=feature)
+        self.rate_limits.append(RestRateLimit(time.monotonic(), feature, route, retry_after, scope))
+        self.logger.warning(f"⏳ Rate limit on {route} ({feature}, {scope}): retry after {retry_after:.2f}s")
+
+    def _trim(self) -> None:
+        cutoff = time.monotonic() - self.WINDOW
+        while self.calls and self.calls[0].at < cutoff:
+            self.calls.popleft()
+        while self.rate_limits and self.rate_limits[0].at < cutoff:
+            self.rate_limits.popleft()
+
+    def report(self) -> List[RestSummary]:
+        self._trim()
+        calls: Dict[str, int] = {}
+        seconds: Dict[str, float] = {}
+        routes: Dict[Tuple[str, str], int] = {}
+        for call in self.calls:
+            calls[call.feature] = calls.get(call.feature, 0) + 1
+            seconds[call.feature] = seconds.get(call.feature, 0.0) + call.elapsed
+            routes[(call.feature, call.route)] = routes.get((call.feature, call.route), 0) + 1
+
+        rate_limited: Dict[str, int] = {}
+        for limit in self.rate_limits:
+            rate_limited[limit.feature] = rate_limited.get(limit.feature, 0) + 1
+
+        summaries = []
+        for feature in calls.keys() | rate_limited.keys():
+            feature_routes = [(count, route) for (name, route), count in routes.items() if name == feature]
+            top_route = max(feature_routes)[1] if feature_routes else "-"
+            summaries.append(RestSummary(feature, calls.get(feature, 0), seconds.get(feature, 0.0),
+                                         rate_limited.get(feature, 0), top_route))
+        return sorted(summaries, key=lambda summary: summary.calls, reverse=True)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.REPORT_INTERVAL)
+            report = self.report()
+            if not report:
+                continue
+
+            self.logger.info(f"📡 REST calls in the last {self.WINDOW // 60} minutes:")
+            for summary in report:
+                self.logger.info(
+                    f" - {summary.feature}: {summary.calls} calls, {summary.seconds:.1f}s, "
+                    f"{summary.rate_limited} rate limited, mostly {summary.top_route}"
+                )
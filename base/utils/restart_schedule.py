@@ -0,0 +1,80 @@
+import asyncio
+import json
+import os
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from base.logger import Logger
+
+
+class RestartSchedule:
+    # Upper bound for a sleep so edits to the txAdmin config are noticed even without a reload signal
+    MAX_SLEEP = 3600
+
+    def __init__(self, path: str):
+        self.logger = Logger(__name__).get_logger()
+        self.path = path
+        self.offsets: List[int] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._changed = asyncio.Event()
+
+    def refresh(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            if self._signature is not None:
+                self.logger.error(f"Die Datei {self.path} existiert nicht!")
+            self._signature = None
+            self.offsets = []
+            return False
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                config = json.load(file)
+            schedule = config.get("monitor", {}).get("restarterSchedule", [])
+            offsets = set()
+            for entry in schedule:
+                hours, minutes = entry.split(":")
+                offsets.add(int(hours) * 3600 + int(minutes) * 60)
+            self.offsets = sorted(offsets)
+        except (json.JSONDecodeError, ValueError, AttributeError) as e:
+            self.logger.error(f"Fehler: Die Config-Datei ist keine gültige JSON-Datei: {e}")
+            self.offsets = []
+
+        self.logger.debug(f"Restart schedule loaded: {len(self.offsets)} entries")
+        return True
+
+    def next_restart(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        self.refresh()
+        if not self.offsets:
+            return None
+
+        now = now or datetime.now()
+        midnight = datetime.combine(now.date(), datetime.min.time())
+        seconds = (now - midnight).total_seconds()
+
+        index = bisect_right(self.offsets, seconds)
+        if index < len(self.offsets):
+            return midnight + timedelta(seconds=self.offsets[index])
+        return midnight + timedelta(days=1, seconds=self.offsets[0])
+
+    def reload(self) -> None:
+        self._signature = None
+        self._changed.set()
+
+    async def wait_until_next_change(self, next_restart: Optional[datetime]) -> None:
+        timeout = self.MAX_SLEEP
+        if next_restart is not None:
+            timeout = min(timeout, max(0.0, (next_restart - datetime.now()).total_seconds()) + 1)
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+import aiohttp
+
+from base.logger import Logger
+from base.config import BotConfig
+from base.utils.http_client import HttpClient
+
+
+class ServerSnapshot(NamedTuple):
+    online: bool
+    status_code: Optional[int]
+    player_count: Optional[int]
+    players: Tuple[str, ...]
+    latency: Optional[float]
+    timestamp: datetime
+
+    @property
+    def status_text(self) -> str:
+        if not self.online:
+            return "🔴 Server ist offline"
+        if self.status_code != 200:
+            return "🟡 Server Started grade"
+        return "🟢 Server ist online"
+
+    @property
+    def players_text(self) -> str:
+        if not self.online:
+            return "Server ist offline"
+        if self.player_count is None:
+            return "Fehler bei der Spielerabfrage"
+        return f"{self.player_count} Spieler"
+
+
+class ServerPoller:
+    POLL_INTERVAL = 15
+
+    def __init__(self, interval: float = POLL_INTERVAL, config: Optional[BotConfig] = None):
+        self.config = config or BotConfig()
+        self.http = HttpClient()
+        self.logger = Logger(__name__).get_logger()
+        self.interval = interval
+        self.snapshot: Optional[ServerSnapshot] = None
+        self._updated = asyncio.Event()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                self._publish(await self.poll())
+            except Exception as e:
+                self.logger.error(f"❌ Fehler beim Abfragen des Servers: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def poll(self) -> ServerSnapshot:
+        started = time.perf_counter()
+        try:
+            info = await self.http.get(self.config.SERVER_INFO_URL, timeout=5)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return ServerSnapshot(False, None, None, (), None, datetime.now())
+
+        latency = (time.perf_counter() - started) * 1000
+        player_count = None
+        players: Tuple[str, ...] = ()
+
+        if info.status == 200:
+            try:
+                response = await self.http.get(self.config.SERVER_PLAYERS_URL, headers={'Cache-Control': 'no-cache'})
+                if response.status == 200:
+                    data = response.json()
+                    players = tuple(str(player.get("name", "")) for player in data)
+                    player_count = len(players)
+                else:
+                    self.logger.error(f"❌ Fehler beim Abrufen der Spieler: Statuscode {response.status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error(f"❌ Fehler beim Abrufen der Daten: {e}")
+            except (ValueError, AttributeError) as e:
+                self.logger.error(f"❌ Fehler beim Verarbeiten der JSON-Daten: {e}")
+        else:
+            self.logger.error(f"Server ist erreichbar, aber Statuscode {info.status}")
+
+        return ServerSnapshot(True, info.status, player_count, players, latency, datetime.now())
+
+    def _publish(self, snapshot: ServerSnapshot) -> None:
+        self.snapshot = snapshot
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    async def next_snapshot(self, last: Optional[ServerSnapshot] = None) -> ServerSnapshot:
+        # Returns immediately if a snapshot newer than `last` is already available
+        if self.snapshot is not None and self.snapshot is not last:
+            return self.snapshot
+        await self._updated.wait()
+        return self.snapshot
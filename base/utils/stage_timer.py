@@ -0,0 +1,22 @@
+import time
+from typing import List, Tuple
+
+
+class StageTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.last = self.started
+        self.stages: List[Tuple[str, float]] = []
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages.append((stage, (now - self.last) * 1000))
+        self.last = now
+
+    @property
+    def total_ms(self) -> float:
+        return (self.last - self.started) * 1000
+
+    def summary(self) -> str:
+        stages = " ".join(f"{stage}={elapsed:.0f}ms" for stage, elapsed in self.stages)
+        return f"{stages} total={self.total_ms:.0f}ms"
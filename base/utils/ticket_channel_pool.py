@@ -0,0 +1,104 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import discord
+from discord.errors import Forbidden, HTTPException, NotFound
+
+from base.logger import Logger
+from base.config import BotConfig
+from base.utils.rest_metrics import current_feature
+
+
+class TicketChannelPool:
+    CHANNEL_PREFIX = "ticket-pool"
+    # Pause between two channel creations, keeps the refill well below the channel create rate limit
+    REFILL_DELAY = 5
+
+    def __init__(self, config: Optional[BotConfig] = None):
+        self.config = config or BotConfig()
+        self.logger = Logger(__name__).get_logger()
+        self.size = self.config.TICKET_CHANNEL_POOL_SIZE
+        self.guild: Optional[discord.Guild] = None
+        self.category_names: List[str] = []
+        self.channels: Dict[str, List[int]] = {}
+        self._categories: Dict[str, int] = {}
+        self._category_locks: Dict[str, asyncio.Lock] = {}
+        self._refill_task: Optional[asyncio.Task] = None
+
+    async def get_category(self, guild: discord.Guild, name: str) -> discord.CategoryChannel:
+        category = guild.get_channel(self._categories.get(name, 0))
+        if isinstance(category, discord.CategoryChannel):
+            return category
+
+        lock = self._category_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            category = discord.utils.get(guild.categories, name=name)
+            if not category:
+                category = await guild.create_category(name)
+            self._categories[name] = category.id
+        return category
+
+    def start(self, guild: discord.Guild, category_names: List[str]) -> None:
+        self.guild = guild
+        self.category_names = category_names
+        if self.size <= 0:
+            return
+
+        # Hidden channels left over from the last run are adopted instead of created again
+        for name in category_names:
+            category = discord.utils.get(guild.categories, name=name)
+            channels = category.text_channels if category else []
+            self.channels[name] = [channel.id for channel in channels if channel.name.startswith(self.CHANNEL_PREFIX)]
+
+        self.logger.info(f"🎫 Ticket channel pool: {sum(len(ids) for ids in self.channels.values())} channels adopted")
+        self.schedule_refill()
+
+    def claim(self, category_name: str) -> Optional[discord.TextChannel]:
+        pool = self.channels.get(category_name, [])
+        while pool:
+            channel = self.guild.get_channel(pool.pop())
+            if isinstance(channel, discord.TextChannel):
+                return channel
+        return None
+
+    async def activate(self, category_name: str, **fields) -> Optional[discord.TextChannel]:
+        channel = self.claim(category_name)
+        if channel is None:
+            return None
+
+        try:
+            # A single edit turns the hidden channel into the ticket channel
+            channel = await channel.edit(**fields)
+        except (Forbidden, NotFound, HTTPException) as e:
+            self.logger.error(f"Pool channel {channel.id} could not be claimed: {e}")
+            channel = None
+        finally:
+            self.schedule_refill()
+        return channel
+
+    def schedule_refill(self) -> None:
+        if self.size <= 0 or self.guild is None:
+            return
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self) -> None:
+        # Runs in its own task, started from ticket creation, so the refill is accounted separately
+        current_feature.set("ticket_pool")
+        for name in self.category_names:
+            pool = self.channels.setdefault(name, [])
+            while len(pool) < self.size:
+                try:
+                    category = await self.get_category(self.guild, name)
+                    channel = await self.guild.create_text_channel(
+                        name=f"{self.CHANNEL_PREFIX}-{len(pool) + 1}",
+                        category=category,
+                        overwrites={self.guild.default_role: discord.PermissionOverwrite(view_channel=False)},
+                    )
+                except (Forbidden, HTTPException) as e:
+                    self.logger.error(f"Pool channel for {name} could not be created: {e}")
+                    return
+
+                pool.append(channel.id)
+                self.logger.debug(f"Pool channel {channel.id} created for {name} ({len(pool)}/{self.size})")
+                await asyncio.sleep(self.REFILL_DELAY)
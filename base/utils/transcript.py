@@ -0,0 +1,199 @@
+import abc
+import asyncio
+import gzip
+import html
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+import discord
+
+from base.logger import Logger
+
+
+class TranscriptRenderer(abc.ABC):
+    extension = "txt"
+
+    def header(self, channel: discord.TextChannel) -> str:
+        return ""
+
+    @abc.abstractmethod
+    def message(self, message: discord.Message) -> str:
+        ...
+
+    def footer(self, generated_by: str) -> str:
+        return ""
+
+
+class MarkdownRenderer(TranscriptRenderer):
+    extension = "md"
+
+    def header(self, channel: discord.TextChannel) -> str:
+        return f"# Transcript of {channel.name}:\n"
+
+    def message(self, message: discord.Message) -> str:
+        created = datetime.strftime(message.created_at, "%m/%d/%Y at %H:%M:%S")
+
+        if message.edited_at:
+            edited = datetime.strftime(message.edited_at, "%m/%d/%Y at %H:%M:%S")
+            line = f"{message.author} on {created}: {message.clean_content} (Edited at {edited})\n"
+        else:
+            line = f"{message.author} on {created}: {message.clean_content}\n"
+
+        for attachment in message.attachments:
+            if attachment.content_type and attachment.content_type.startswith("image/"):
+                line += f"  - Image: [Download {attachment.filename}]({attachment.url})\n"
+            else:
+                line += f"  - File: [Download {attachment.filename}]({attachment.url})\n"
+        return line
+
+    def footer(self, generated_by: str) -> str:
+        generated = datetime.now().strftime("%m/%d/%Y at %H:%M:%S")
+        return f"\n*Generated at {generated} by {generated_by}*\n*Date Formatting: MM/DD/YY*\n*Time Zone: UTC*"
+
+
+class HtmlRenderer(TranscriptRenderer):
+    extension = "html"
+
+    def header(self, channel: discord.TextChannel) -> str:
+        title = html.escape(channel.name)
+        return (
+            f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Transcript of {title}</title></head>\n"
+            f"<body>\n<h1>Transcript of {title}</h1>\n"
+        )
+
+    def message(self, message: discord.Message) -> str:
+        created = datetime.strftime(message.created_at, "%m/%d/%Y %H:%M:%S")
+        edited = f" <i>(Edited at {datetime.strftime(message.edited_at, '%m/%d/%Y %H:%M:%S')})</i>" if message.edited_at else ""
+        attachments = "".join(
+            f"<li><a href=\"{html.escape(attachment.url)}\">{html.escape(attachment.filename)}</a></li>"
+            for attachment in message.attachments
+        )
+        if attachments:
+            attachments = f"<ul>{attachments}</ul>"
+        return (
+            f"<p><b>{html.escape(str(message.author))}</b> <small>{created}</small>{edited}<br>"
+            f"{html.escape(message.clean_content)}</p>{attachments}\n"
+        )
+
+    def footer(self, generated_by: str) -> str:
+        generated = datetime.now().strftime("%m/%d/%Y %H:%M:%S")
+        return f"<hr><small>Generated at {generated} by {html.escape(generated_by)} (UTC)</small>\n</body></html>\n"
+
+
+class JsonlRenderer(TranscriptRenderer):
+    extension = "jsonl"
+
+    def message(self, message: discord.Message) -> str:
+        return json.dumps({
+            "id": message.id,
+            "author_id": message.author.id,
+            "author": str(message.author),
+            "created_at": message.created_at.isoformat(),
+            "edited_at": message.edited_at.isoformat() if message.edited_at else None,
+            "content": message.clean_content,
+            "attachments": [attachment.url for attachment in message.attachments],
+        }, ensure_ascii=False) + "\n"
+
+
+RENDERERS: Dict[str, Type[TranscriptRenderer]] = {
+    "markdown": MarkdownRenderer,
+    "html": HtmlRenderer,
+    "jsonl": JsonlRenderer,
+}
+
+
+class TranscriptEngine:
+    UPLOAD_LIMIT = 10 * 1024 * 1024
+    SPOOL_SIZE = 1024 * 1024
+    WRITE_BATCH = 100
+    FILES_PER_MESSAGE = 10
+
+    _active: Set[int] = set()
+
+    def __init__(self, renderer: str = "markdown", upload_limit: int = UPLOAD_LIMIT):
+        self.logger = Logger(__name__).get_logger()
+        self.renderer = RENDERERS[renderer]()
+        self.upload_limit = upload_limit
+
+    async def render(self, channel: discord.TextChannel, generated_by: str) -> Tuple[tempfile.SpooledTemporaryFile, int]:
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE, mode="w+b")
+        batch = [self.renderer.header(channel)]
+        message_count = 0
+
+        async for message in channel.history(limit=None, oldest_first=True):
+            batch.append(self.renderer.message(message))
+            message_count += 1
+            if len(batch) >= self.WRITE_BATCH:
+                buffer.write("".join(batch).encode("utf-8"))
+                batch.clear()
+
+        batch.append(self.renderer.footer(generated_by))
+        buffer.write("".join(batch).encode("utf-8"))
+        return buffer, message_count
+
+    async def build_files(self, channel: discord.TextChannel, generated_by: str,
+                          buffer: Optional[tempfile.SpooledTemporaryFile] = None) -> List[discord.File]:
+        if buffer is None:
+            buffer, _ = await self.render(channel, generated_by)
+        size = buffer.seek(0, os.SEEK_END)
+        buffer.seek(0)
+        filename = f"{channel.name}.{self.renderer.extension}"
+
+        if size <= self.upload_limit:
+            return [discord.File(buffer, filename)]
+
+        compressed = await asyncio.to_thread(self._compress, buffer)
+        if compressed.tell() <= self.upload_limit:
+            compressed.seek(0)
+            buffer.close()
+            return [discord.File(compressed, f"{filename}.gz")]
+
+        compressed.close()
+        buffer.seek(0)
+        return await asyncio.to_thread(self._split, buffer, filename)
+
+    def _compress(self, buffer: tempfile.SpooledTemporaryFile) -> tempfile.SpooledTemporaryFile:
+        compressed = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE, mode="w+b")
+        with gzip.GzipFile(fileobj=compressed, mode="wb") as archive:
+            shutil.copyfileobj(buffer, archive)
+        return compressed
+
+    def _split(self, buffer: tempfile.SpooledTemporaryFile, filename: str) -> List[discord.File]:
+        # Split on line boundaries so every part stays readable on its own
+        parts = []
+        part = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE, mode="w+b")
+        for line in buffer:
+            if part.tell() and part.tell() + len(line) > self.upload_limit:
+                parts.append(part)
+                part = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE, mode="w+b")
+            part.write(line)
+        parts.append(part)
+        buffer.close()
+
+        name, extension = filename.rsplit(".", 1)
+        files = []
+        for index, part in enumerate(parts, start=1):
+            part.seek(0)
+            files.append(discord.File(part, f"{name}.part{index}.{extension}"))
+        return files
+
+    async def send(self, send: Callable[..., Awaitable], channel: discord.TextChannel, generated_by: str,
+                   content: Optional[str] = None, buffer: Optional[tempfile.SpooledTemporaryFile] = None,
+                   **kwargs) -> bool:
+        if channel.id in self._active:
+            return False
+
+        self._active.add(channel.id)
+        try:
+            files = await self.build_files(channel, generated_by, buffer)
+            for start in range(0, len(files), self.FILES_PER_MESSAGE):
+                await send(content=content if start == 0 else None,
+                           files=files[start:start + self.FILES_PER_MESSAGE], **kwargs)
+            self.logger.debug(f"Transcript of {channel.name} sent in {len(files)} file(s)")
+        finally:
+            self._active.discard(channel.id)
+        return True
@@ -0,0 +1,87 @@
+import asyncio
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from typing import IO, Iterator, Optional, Tuple
+
+import discord
+
+from base.logger import Logger
+from base.config import BotConfig
+from base.database import Database
+from base.utils.transcript import TranscriptEngine
+
+
+class TranscriptArchive:
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, config: Optional[BotConfig] = None, database: Optional[Database] = None,
+                 engine: Optional[TranscriptEngine] = None):
+        self.config = config or BotConfig()
+        self.database = database or Database()
+        self.engine = engine or TranscriptEngine()
+        self.logger = Logger(__name__).get_logger()
+        self.path = os.path.join(self.config.DATA_PATH, "transcripts")
+
+    def file_path(self, content_hash: str) -> str:
+        return os.path.join(self.path, content_hash[:2], f"{content_hash}.md.gz")
+
+    async def archive(self, ticket: Optional[Tuple], channel: discord.TextChannel, closed_by: str,
+                      rendered: Optional[Tuple[tempfile.SpooledTemporaryFile, int]] = None) -> Optional[str]:
+        if ticket is None:
+            self.logger.warning(f"⚠️ Kanal {channel.name} hat kein Ticket, es wird kein Transcript archiviert")
+            return None
+
+        try:
+            # A buffer rendered by the caller stays open, it is sent afterwards
+            buffer, message_count = rendered or await self.engine.render(channel, closed_by)
+            content_hash, byte_size, compressed_size = await asyncio.to_thread(self._store, buffer)
+            if rendered is None:
+                buffer.close()
+        except (discord.HTTPException, OSError) as e:
+            self.logger.error(f"❌ Transcript für Ticket {ticket[0]} konnte nicht archiviert werden: {e}")
+            return None
+
+        opened_at = ticket[5] if len(ticket) > 5 else None
+        await self.database.add_transcript(ticket[0], ticket[1], ticket[2], opened_at, int(time.time()),
+                                           content_hash, byte_size, compressed_size, message_count)
+        self.logger.info(f"📦 Transcript für Ticket {ticket[0]} archiviert ({message_count} Nachrichten)")
+        return content_hash
+
+    def _store(self, buffer: tempfile.SpooledTemporaryFile) -> Tuple[str, int, int]:
+        digest = hashlib.sha256()
+        buffer.seek(0)
+        for chunk in iter(lambda: buffer.read(self.CHUNK_SIZE), b""):
+            digest.update(chunk)
+        byte_size = buffer.tell()
+        content_hash = digest.hexdigest()
+
+        path = self.file_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a truncated archive behind
+            temporary = f"{path}.tmp"
+            buffer.seek(0)
+            with gzip.open(temporary, "wb") as archive:
+                shutil.copyfileobj(buffer, archive, self.CHUNK_SIZE)
+            os.replace(temporary, path)
+
+        return content_hash, byte_size, os.path.getsize(path)
+
+    def open(self, content_hash: str) -> IO[bytes]:
+        return gzip.open(self.file_path(content_hash), "rb")
+
+    def stream(self, content_hash: str) -> Iterator[bytes]:
+        with self.open(content_hash) as archive:
+            for chunk in iter(lambda: archive.read(self.CHUNK_SIZE), b""):
+                yield chunk
+
+    def as_file(self, transcript: Tuple, upload_limit: int = TranscriptEngine.UPLOAD_LIMIT) -> discord.File:
+        ticket_uuid, content_hash, byte_size = transcript[0], transcript[5], transcript[6]
+        if byte_size <= upload_limit:
+            return discord.File(self.open(content_hash), f"transcript-{ticket_uuid[:8]}.md")
+        # Too large to send decompressed, hand out the stored archive as it is
+        return discord.File(self.file_path(content_hash), f"transcript-{ticket_uuid[:8]}.md.gz")
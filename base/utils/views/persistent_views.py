@@ -0,0 +1,34 @@
+from typing import Dict, Tuple, Type
+
+import discord
+
+from base.logger import Logger
+from base.utils.views.verify_view import VerifyButton
+from base.utils.views.ticket_view import TicketView, UserButton
+
+
+class PersistentViewRegistry:
+    VIEWS: Tuple[Type[discord.ui.View], ...] = (TicketView, UserButton, VerifyButton)
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+        self.logger = Logger(__name__).get_logger()
+        self.views: Dict[Type[discord.ui.View], discord.ui.View] = {}
+
+    def register(self) -> None:
+        # One instance per view class, dispatched by custom_id for every message that carries its components
+        for view_class in self.VIEWS:
+            if view_class in self.views:
+                continue
+
+            view = view_class(self.bot)
+            self.bot.add_view(view)
+            self.views[view_class] = view
+
+            custom_ids = [item.custom_id for item in view.children]
+            self.logger.info(f" - 🧷 Registered {view_class.__name__}: {', '.join(custom_ids)}")
+
+    def get(self, view_class: Type[discord.ui.View]) -> discord.ui.View:
+        if view_class not in self.views:
+            self.register()
+        return self.views[view_class]
@@ -1,87 +1,105 @@
+import asyncio
 import discord
 import uuid
+from typing import List, Set
 
-from base.config import BotConfig
-from base.database import Database
-from base.utils.embeds.ticket_embed import EmbedTicket
+from base.services import Services
 from base.utils.modals.ticket_modal import TicketReasonModal, TicketForwardModal, TicketRenameModal
 from base.logger import Logger
-from base.utils.utilities import Utilities
+from base.utils.stage_timer import StageTimer
+from base.utils.rest_metrics import rest_feature
 
 class ConfirmClose(discord.ui.View):
-    def __init__(self):
+    def __init__(self, services: Services):
         super().__init__()
         self.logger = Logger(__name__).get_logger()
-        self.database = Database()
+        self.services = services
+        self.database = services.database
 
-    @discord.ui.button(label="Ja ✅", style=discord.ButtonStyle.green)
+    @discord.ui.button(label="Ja ✅", style=discord.ButtonStyle.green, custom_id="confirm_close")
     async def confirm(self, _, interaction: discord.Interaction):
+        await interaction.response.defer()
         ticket = await self.database.get_ticket_by_channel_id(interaction.channel.id)
+        await self.services.transcripts.archive(ticket, interaction.channel, str(interaction.user))
         await interaction.channel.delete()
-        await self.database.remove_ticket(ticket[0])
+        if ticket is not None:
+            await self.database.remove_ticket(ticket[0])
 
 
-    @discord.ui.button(label="Nein ❌", style=discord.ButtonStyle.red)
+    @discord.ui.button(label="Nein ❌", style=discord.ButtonStyle.red, custom_id="cancel_close")
     async def cancel(self, _, interaction: discord.Interaction):
         await interaction.message.delete()
 
 
 class UserButton(discord.ui.View):
-    def __init__(self, bot: discord.Bot, member: discord.Member):
+    # Registered once at startup, the ticket is resolved from the channel on every click
+    def __init__(self, bot: discord.Bot):
         super().__init__(timeout=None)
         self.bot = bot
-        self.config = BotConfig()
-        self.utils = Utilities()
+        self.services = bot.services
+        self.config = self.services.config
+        self.utils = self.services.utils
+        self.embeds = self.services.embeds
         self.logger = Logger(__name__).get_logger()
-        self.database = Database()
-        self.ticket_user = member
+        self.database = self.services.database
 
     @discord.ui.button(label="Ticket übernehmen", style=discord.ButtonStyle.red, emoji="🔁", custom_id="take_over")
     async def take_over(self, _, interaction: discord.Interaction):
         if self.utils.check_user_has_role(interaction.user, self.config.DELTA_TEAM_ROLE_ID):
-            await interaction.response.send_message(embed=EmbedTicket().ticket_claimed(interaction.guild.icon.url), ephemeral=True)
-            await interaction.channel.set_permissions(self.utils.ticket_takeover_permission(interaction.user, self.ticket_user))
+            ticket = await self.database.get_ticket_by_channel_id(interaction.channel.id)
+            ticket_user = interaction.guild.get_member(ticket[1]) if ticket else None
+            if ticket_user is None:
+                await interaction.response.send_message(embed=self.embeds.ticket.ticket_not_found(interaction.guild.icon.url), ephemeral=True)
+                return
+
+            await interaction.response.send_message(embed=self.embeds.ticket.ticket_claimed(interaction.guild.icon.url), ephemeral=True)
+            await interaction.channel.edit(overwrites=self.utils.ticket_takeover_permission(interaction, ticket_user))
             return
-        await interaction.response.send_message(embed=EmbedTicket().ticket_no_perm_claim(interaction.guild.icon.url), ephemeral=True)
+        await interaction.response.send_message(embed=self.embeds.ticket.ticket_no_perm_claim(interaction.guild.icon.url), ephemeral=True)
 
     @discord.ui.button(label="Ticket zuweisen", style=discord.ButtonStyle.red, emoji="🔀", custom_id="assign_ticket")
     async def forward(self, _, interaction: discord.Interaction):
         if self.utils.check_user_has_role(interaction.user, self.config.DELTA_TEAM_ROLE_ID):
-            await interaction.response.send_modal(TicketForwardModal(interaction.guild))
+            await interaction.response.send_modal(TicketForwardModal(self.services, interaction.guild))
             return
-        await interaction.response.send_message(embed=EmbedTicket().ticket_no_perm_forward(interaction.guild.icon.url), ephemeral=True)
+        await interaction.response.send_message(embed=self.embeds.ticket.ticket_no_perm_forward(interaction.guild.icon.url), ephemeral=True)
 
     @discord.ui.button(label="Umbenennen", style=discord.ButtonStyle.red, emoji="📝", custom_id="rename_ticket")
     async def rename(self, _, interaction: discord.Interaction):
         if self.utils.check_user_has_role(interaction.user, self.config.DELTA_TEAM_ROLE_ID):
-            await interaction.response.send_modal(TicketRenameModal())
+            await interaction.response.send_modal(TicketRenameModal(self.services))
             return
-        await interaction.response.send_message(embed=EmbedTicket().no_permission_rename(interaction.guild.icon.url), ephemeral=True)
+        await interaction.response.send_message(embed=self.embeds.ticket.no_permission_rename(interaction.guild.icon.url), ephemeral=True)
 
     @discord.ui.button(label="Ticket schließen", style=discord.ButtonStyle.primary, emoji="🔒", custom_id="close_ticket")
     async def close_ticket(self, _, interaction: discord.Interaction):
         await interaction.response.send_message(
-            embed=EmbedTicket().confirm_ticket_close(interaction.guild.icon.url),
-            view=ConfirmClose(), ephemeral=True
+            embed=self.embeds.ticket.confirm_ticket_close(interaction.guild.icon.url),
+            view=ConfirmClose(self.services), ephemeral=True
         )
 
     @discord.ui.button(label="Ticket schließen mit Grund", style=discord.ButtonStyle.secondary, emoji="📝", custom_id="close_ticket_reason")
     async def close_ticket_reason(self, _, interaction: discord.Interaction):
-        await interaction.response.send_modal(TicketReasonModal())
+        await interaction.response.send_modal(TicketReasonModal(self.services))
 
     @discord.ui.button(label="Transcript", style=discord.ButtonStyle.primary, emoji="📜", custom_id="transcript")
     async def transcript(self, _, interaction: discord.Interaction):
         await interaction.response.defer()
-        await self.utils.transcript(interaction, self.bot)
+        sent = await self.services.transcript_engine.send(interaction.followup.send, interaction.channel, str(self.bot.user), ephemeral=True)
+        if not sent:
+            await interaction.followup.send("A transcript is already being generated!", ephemeral=True)
 
 
 class TicketDropdown(discord.ui.Select):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
         self.logger = Logger(__name__).get_logger()
-        self.database = Database()
-        self.utils = Utilities()
-        self.config = BotConfig()
+        self.database = bot.services.database
+        self.utils = bot.services.utils
+        self.config = bot.services.config
+        self.embeds = bot.services.embeds
+        self.ticket_pool = bot.services.ticket_pool
+        self._pending: Set[int] = set()
 
         options = [
             discord.SelectOption(
@@ -132,78 +150,96 @@ class TicketDropdown(discord.ui.Select):
             custom_id="ticket_dropdown"
         )
 
+    @property
+    def categories(self) -> List[str]:
+        return [option.label for option in self.options]
+
     async def callback(self, interaction: discord.Interaction):
         selected_category = self.values[0]
+        timer = StageTimer()
+
+        await interaction.response.defer(ephemeral=True)
+        timer.mark("defer")
 
         if interaction.guild.get_role(self.config.DELTA_TEAM_ROLE_ID) in interaction.user.roles:
-            await interaction.response.send_message(embed=EmbedTicket().already_in_team(interaction.guild.icon.url), ephemeral=True)
+            await interaction.followup.send(embed=self.embeds.ticket.already_in_team(interaction.guild.icon.url), ephemeral=True)
+            return
+
+        # Single flight per user, a double click must not create a second channel
+        if interaction.user.id in self._pending:
+            await interaction.followup.send(embed=self.embeds.ticket.ticket_already_open(interaction.guild.icon.url), ephemeral=True)
             return
 
+        self._pending.add(interaction.user.id)
+        try:
+            with rest_feature("ticket_create"):
+                await self.create_ticket(interaction, selected_category, timer)
+        finally:
+            self._pending.discard(interaction.user.id)
+
+    async def create_ticket(self, interaction: discord.Interaction, selected_category: str, timer: StageTimer):
         existing_ticket = await self.database.get_tickets(interaction.user.id)
+        timer.mark("lookup")
 
         if existing_ticket:
-            await interaction.response.send_message(
-                embed=EmbedTicket().ticket_already_open(interaction.guild.icon.url),
-                ephemeral=True
-            )
+            await interaction.followup.send(embed=self.embeds.ticket.ticket_already_open(interaction.guild.icon.url), ephemeral=True)
             return
 
-        category = discord.utils.get(interaction.guild.categories, name=selected_category)
-        if not category:
-            category = await interaction.guild.create_category(selected_category)
-
-        ticket_uuid = str(uuid.uuid4())
-
-        ticket_channel = await interaction.guild.create_text_channel(
+        fields = dict(
             name=f"ticket-{interaction.user.name}",
-            category=category,
             overwrites=self.utils.ticket_permission(interaction),
             topic=f"Ticket von {interaction.user.name} | Kategorie: {selected_category}",
         )
-
         try:
-            await self.database.add_ticket(
-                uuid=ticket_uuid,
-                user_id=interaction.user.id,
-                category=selected_category,
-                channel_id=ticket_channel.id,
-                guild_id=interaction.guild.id,
-            )
-            self.logger.info(f"Ticket {ticket_uuid} erfolgreich erstellt und gespeichert.")
-        except Exception as e:
-            self.logger.error(f"Fehler beim Speichern des Tickets: {e}")
-            await interaction.response.send_message(
+            ticket_channel = await self.ticket_pool.activate(selected_category, **fields)
+            if ticket_channel is not None:
+                category = ticket_channel.category
+                timer.mark("claim")
+            else:
+                category = await self.ticket_pool.get_category(interaction.guild, selected_category)
+                timer.mark("category")
+                ticket_channel = await interaction.guild.create_text_channel(category=category, **fields)
+                timer.mark("channel")
+        except discord.HTTPException as e:
+            self.logger.error(f"Fehler beim Erstellen des Ticket-Kanals: {e}")
+            await interaction.followup.send(
                 "Ein Fehler ist beim Erstellen deines Tickets aufgetreten. Bitte versuche es später erneut.",
                 ephemeral=True
             )
             return
 
-        try:
-            await ticket_channel.send(interaction.user.mention,
-                                      embed=EmbedTicket().ticket_channel_info(category, interaction.guild.icon.url),
-                                      view=UserButton(self.bot, interaction.user))
+        ticket = (str(uuid.uuid4()), interaction.user.id, selected_category, ticket_channel.id, interaction.guild.id)
 
-            ticket = await self.database.get_ticket_by_channel_id(ticket_channel.id)
-            await interaction.response.send_message(
-                embed=EmbedTicket().ticket_created(ticket_channel, ticket),
-                ephemeral=True
-            )
+        # The ticket row, the welcome message and the dropdown reset do not depend on each other
+        _, welcome, _ = await asyncio.gather(
+            self.database.add_ticket(*ticket),
+            ticket_channel.send(interaction.user.mention,
+                                embed=self.embeds.ticket.ticket_channel_info(category, interaction.guild.icon.url),
+                                view=self.bot.view_registry.get(UserButton)),
+            interaction.message.edit(view=self.view),
+            return_exceptions=True
+        )
+        timer.mark("publish")
 
-        except Exception as e:
-            self.logger.error(f"Fehler beim Senden der Nachricht im Ticket-Kanal: {e}")
-            await interaction.response.send_message(
+        if isinstance(welcome, Exception):
+            self.logger.error(f"Fehler beim Senden der Nachricht im Ticket-Kanal: {welcome}")
+            await interaction.followup.send(
                 "Dein Ticket wurde erstellt, aber eine Nachricht konnte nicht gesendet werden.",
                 ephemeral=True
             )
-            raise e
+            return
+
+        await interaction.followup.send(embed=self.embeds.ticket.ticket_created(ticket_channel, ticket),
+                                        ephemeral=True, delete_after=10)
+        timer.mark("respond")
 
-        view = TicketView(self.bot)
-        await interaction.message.edit(view=view)
-        await interaction.delete_original_response(delay=10)
+        self.logger.info(f"Ticket {ticket[0]} erfolgreich erstellt und gespeichert.")
+        self.logger.debug(f"Ticket pipeline for {interaction.user.id}: {timer.summary()}")
 
 
 class TicketView(discord.ui.View):
     def __init__(self, bot: discord.Bot):
         super().__init__(timeout=None)
         self.bot = bot
-        self.add_item(TicketDropdown(self.bot))
+        self.dropdown = TicketDropdown(self.bot)
+        self.add_item(self.dropdown)
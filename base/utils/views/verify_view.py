@@ -1,18 +1,15 @@
 import discord
 
-from base.database import Database
-from base.utils.utilities import Utilities
-from base.utils.embeds.verify_embed import EmbedVerify
-
 
 class VerifyButton(discord.ui.View):
     def __init__(self, bot: discord.Bot):
         super().__init__(timeout=None)
         self.bot = bot
-        self.database = Database()
-        self.utils = Utilities()
+        self.database = bot.services.database
+        self.utils = bot.services.utils
+        self.embeds = bot.services.embeds
 
-    @discord.ui.button(label="🔒 Verifizierung", style=discord.ButtonStyle.green)
+    @discord.ui.button(label="🔒 Verifizierung", style=discord.ButtonStyle.green, custom_id="verify")
     async def verify(self, button: discord.ui.Button, interaction: discord.Interaction):
         role = interaction.guild.get_role(self.utils.config.EINWOHNER_ROLE_ID)
         user = await self.utils.check_user_account(interaction.user)
@@ -20,20 +17,20 @@ class VerifyButton(discord.ui.View):
         try:
             if await self.database.check_user(interaction.user.id):
                 await interaction.response.send_message(
-                    embed=EmbedVerify().verify_already_verified_embed(interaction.guild.icon.url),
+                    embed=self.embeds.verify.verify_already_verified_embed(interaction.guild.icon.url),
                     ephemeral=True
                 )
                 return
 
             if user is False:
                 await interaction.response.send_message(
-                    embed=EmbedVerify().verify_failed_credentials_embed(interaction.guild.icon.url, channel),
+                    embed=self.embeds.verify.verify_failed_credentials_embed(interaction.guild.icon.url, channel),
                     ephemeral=True
                 )
                 return
 
             await interaction.response.send_message(
-                embed=EmbedVerify().verify_success_embed(interaction.guild.icon.url),
+                embed=self.embeds.verify.verify_success_embed(interaction.guild.icon.url),
                 ephemeral=True
             )
 
@@ -43,7 +40,7 @@ class VerifyButton(discord.ui.View):
 
 
         except Exception as e:
-            await interaction.response.send_message(embed=EmbedVerify().verify_error_embed(interaction.guild.icon.url, e, channel),
+            await interaction.response.send_message(embed=self.embeds.verify.verify_error_embed(interaction.guild.icon.url, e, channel),
                                                     ephemeral=True)
 
 
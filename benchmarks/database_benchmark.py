@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import aiosqlite
+
+from base.database import Database
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SIZES = (10_000, 100_000, 1_000_000)
+ITERATIONS = 1000
+SEED_CHUNK_SIZE = 50_000
+TICKETS_PER_USER = 2
+# Only a small share of the checkouts is overdue at any time, like in production
+EXPIRED_SHARE = 0.001
+CATEGORIES = ("Support", "Bewerbung", "Beschwerde", "Entbannung")
+GUILD_ID = 1
+# Relative change of p99 or throughput that counts as a regression
+THRESHOLD = 0.2
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(samples: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "iterations": len(samples),
+        "ops_per_second": round(len(samples) / elapsed, 1),
+        "p50_ms": round(percentile(samples, 0.5) * 1000, 4),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+    }
+
+
+async def measure(operation: Callable[[int], Awaitable], iterations: int) -> Dict[str, float]:
+    samples = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        call_started = time.perf_counter()
+        await operation(i)
+        samples.append(time.perf_counter() - call_started)
+    return summarize(samples, time.perf_counter() - started)
+
+
+async def seed(database: Database, size: int, now: int) -> float:
+    started = time.perf_counter()
+    expired = max(1, int(size * EXPIRED_SHARE))
+
+    def users(start: int, stop: int):
+        return [(user_id, f"user{user_id}", "0") for user_id in range(start, stop)]
+
+    def tickets(start: int, stop: int):
+        return [
+            (f"{user_id}-{n}", user_id, CATEGORIES[user_id % len(CATEGORIES)], user_id * TICKETS_PER_USER + n, GUILD_ID)
+            for user_id in range(start, stop) for n in range(TICKETS_PER_USER)
+        ]
+
+    def checkouts(start: int, stop: int):
+        return [
+            (user_id, "Urlaub", "01/01/2000", now - 60 if user_id < expired else now + 86400 + user_id)
+            for user_id in range(start, stop)
+        ]
+
+    batches = [
+        ("INSERT INTO users (discord_id, username, discriminator) VALUES (?, ?, ?)", users),
+        ("INSERT INTO tickets (uuid, user_id, category, channel_id, guild_id) VALUES (?, ?, ?, ?, ?)", tickets),
+        ("INSERT INTO checkouts (user_id, reason, duration, expires_at) VALUES (?, ?, ?, ?)", checkouts),
+    ]
+
+    async with database.get_write_connection() as connection:
+        for query, rows in batches:
+            for start in range(0, size, SEED_CHUNK_SIZE):
+                await connection.executemany(query, rows(start, min(size, start + SEED_CHUNK_SIZE)))
+        await connection.commit()
+        await connection.execute("ANALYZE")
+        await connection.commit()
+
+    return time.perf_counter() - started
+
+
+async def run_size(size: int, iterations: int, write_behind: bool, directory: str) -> Dict[str, Dict[str, float]]:
+    database = Database(os.path.join(directory, f"benchmark-{size}.db"))
+    now = int(time.time())
+    rng = random.Random(size)
+
+    await database.create_database()
+    seed_seconds = await seed(database, size, now)
+    print(f"Seeded {size} rows per table in {seed_seconds:.1f}s")
+
+    if write_behind:
+        database.enable_write_behind()
+
+    # Sampled without replacement, every lookup misses the cache and reaches SQLite
+    user_ids = rng.sample(range(size), min(size, iterations))
+    channel_ids = rng.sample(range(size * TICKETS_PER_USER), min(size * TICKETS_PER_USER, iterations))
+    results: Dict[str, Dict[str, float]] = {}
+
+    try:
+        results["add_user"] = await measure(lambda i: database.add_user(size + i, f"new{i}", "0"), iterations)
+        results["check_user"] = await measure(lambda i: database.check_user(user_ids[i % len(user_ids)]), iterations)
+        results["get_ticket_by_channel_id"] = await measure(
+            lambda i: database.get_ticket_by_channel_id(channel_ids[i % len(channel_ids)]), iterations)
+        results["get_tickets"] = await measure(lambda i: database.get_tickets(user_ids[i % len(user_ids)]), iterations)
+        results["get_expired_checkouts"] = await measure(lambda _: database.get_expired_checkouts(now), iterations)
+
+        # One member list with a percent each of new, renamed and departed users, like a guild after a day
+        changed = size // 100
+        members = [(user_id, f"user{user_id}", "0") for user_id in range(2 * changed, size)]
+        members += [(user_id, f"renamed{user_id}", "0") for user_id in range(changed, 2 * changed)]
+        members += [(size + i, f"new{i}", "0") for i in range(iterations)]
+        members += [(size + iterations + n, f"joined{n}", "0") for n in range(changed)]
+        started = time.perf_counter()
+        stats = await database.sync_users(members)
+        elapsed = time.perf_counter() - started
+        results["sync_users"] = {
+            "rows": len(members),
+            "rows_per_second": round(len(members) / elapsed, 1),
+            "seconds": round(elapsed, 3),
+            **stats,
+        }
+        results["seed"] = {"rows": size * (2 + TICKETS_PER_USER), "seconds": round(seed_seconds, 3)}
+    finally:
+        await database.close_connections()
+
+    return results
+
+
+def find_regressions(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    regressions = []
+    for size, operations in current["results"].items():
+        for name, result in operations.items():
+            previous = baseline.get("results", {}).get(size, {}).get(name)
+            if previous is None:
+                continue
+
+            if "p99_ms" in result and result["p99_ms"] > previous["p99_ms"] * (1 + threshold):
+                regressions.append(f"{size} {name}: p99 {previous['p99_ms']} ms -> {result['p99_ms']} ms")
+            for key in ("ops_per_second", "rows_per_second"):
+                if key in result and key in previous and result[key] < previous[key] * (1 - threshold):
+                    regressions.append(f"{size} {name}: {key} {previous[key]} -> {result[key]}")
+    return regressions
+
+
+def latest_result(exclude: Optional[Path] = None) -> Optional[Path]:
+    runs = sorted(path for path in RESULTS_DIR.glob("database-*.json") if path != exclude)
+    return runs[-1] if runs else None
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark base/database.py against seeded SQLite databases")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    parser.add_argument("--write-behind", action="store_true", help="Run the writes through the write-behind queue")
+    parser.add_argument("--output", type=Path, help="Result file, defaults to benchmarks/results/database-<time>.json")
+    parser.add_argument("--baseline", type=Path, help="Previous result to compare against, defaults to the latest run")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    # The database logs every call, on the console that would be measured along with the queries
+    logging.disable(logging.INFO)
+
+    output = args.output or RESULTS_DIR / f"database-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    baseline_path = args.baseline or latest_result(exclude=output)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": aiosqlite.sqlite_version,
+        "iterations": args.iterations,
+        "write_behind": args.write_behind,
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            report["results"][str(size)] = await run_size(size, args.iterations, args.write_behind, directory)
+            for name, result in report["results"][str(size)].items():
+                print(f"{size:>9} {name:<26} {result}")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+    if baseline_path is None or not baseline_path.exists():
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    if (baseline.get("iterations"), baseline.get("write_behind")) != (args.iterations, args.write_behind):
+        print(f"{baseline_path} was run with different settings, skipping the comparison")
+        return 0
+
+    regressions = find_regressions(report, baseline, args.threshold)
+    if not regressions:
+        print(f"No regressions against {baseline_path}")
+        return 0
+
+    print(f"Regressions against {baseline_path}:")
+    for regression in regressions:
+        print(f" - {regression}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
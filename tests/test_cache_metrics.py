@@ -0,0 +1,24 @@
+import asyncio
+
+from base.database import Database
+from base.utils.metrics import MetricsRegistry
+
+
+def test_cache_lookups_are_exported_on_scrape(tmp_path):
+    async def run() -> str:
+        database = Database(str(tmp_path / "bot.db"))
+        await database.create_database()
+        registry = MetricsRegistry()
+        database.register_metrics(registry)
+
+        await database.check_user(1)
+        await database.check_user(1)
+        await database.check_user(1)
+        await database.close_connections()
+        return registry.render()
+
+    rendered = asyncio.run(run())
+    assert "# TYPE database_cache_hits_total counter" in rendered
+    assert 'database_cache_hits_total{cache="users"} 2' in rendered
+    assert 'database_cache_misses_total{cache="users"} 1' in rendered
+    assert 'database_cache_evictions_total{cache="users"} 0' in rendered
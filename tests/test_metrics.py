@@ -0,0 +1,48 @@
+import asyncio
+from unittest import mock
+
+import discord
+
+from base.utils.metrics import InteractionMetrics, InteractionTrackingState, MetricsRegistry
+
+
+class DeferringDropdown(discord.ui.Select):
+    def __init__(self, done: asyncio.Future):
+        super().__init__(custom_id="ticket_dropdown", options=[discord.SelectOption(label="Support")])
+        self.done = done
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        self.done.set_result(interaction.response.is_done())
+
+
+async def create_interaction_response(*args, **kwargs):
+    return {"interaction": {}}
+
+
+def test_deferred_dropdown_records_ack():
+    registry = MetricsRegistry()
+
+    async def run() -> bool:
+        done = asyncio.get_running_loop().create_future()
+        state = InteractionTrackingState(InteractionMetrics(registry), dispatch=lambda *args: None, handlers={},
+                                         hooks={}, http=mock.Mock(), loop=asyncio.get_running_loop())
+        view = discord.ui.View(timeout=None)
+        view.add_item(DeferringDropdown(done))
+        state.store_view(view)
+
+        data = {
+            "id": "1", "application_id": "2", "type": 3, "token": "token", "version": 1,
+            "data": {"custom_id": "ticket_dropdown", "component_type": 3, "values": ["Support"]},
+            "user": {"id": "5", "username": "user", "discriminator": "0", "avatar": None},
+        }
+        with mock.patch("discord.webhook.async_.AsyncWebhookAdapter.create_interaction_response",
+                        new=create_interaction_response):
+            state.parse_interaction_create(data)
+            return await asyncio.wait_for(done, 2)
+
+    assert asyncio.run(run()) is True
+    series = registry.series("discord_interaction_ack_seconds")
+    assert [(labels, histogram.count) for labels, histogram in series] == [
+        ({"type": "component", "name": "ticket_dropdown"}, 1)
+    ]
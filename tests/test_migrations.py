@@ -0,0 +1,15 @@
+import asyncio
+
+import aiosqlite
+
+from base.migrations import MIGRATIONS, apply_migrations, check_query_plans, get_schema_version
+
+
+def test_hot_queries_use_an_index(tmp_path):
+    async def run():
+        async with aiosqlite.connect(tmp_path / "bot.db") as connection:
+            version = await apply_migrations(connection)
+            assert version == await get_schema_version(connection) == MIGRATIONS[-1].version
+            return await check_query_plans(connection)
+
+    assert asyncio.run(run()) == []
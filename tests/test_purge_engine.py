@@ -0,0 +1,66 @@
+import asyncio
+from datetime import timedelta
+
+import discord
+
+from base.utils.purge_engine import PurgeEngine, PurgeProgress
+
+
+class FakeMessage:
+    def __init__(self, age: timedelta):
+        self.created_at = discord.utils.utcnow() - age
+        self.deleted = False
+
+    async def delete(self):
+        self.deleted = True
+
+
+class FakeChannel:
+    def __init__(self):
+        self.bulk = None
+
+    async def delete_messages(self, messages):
+        self.bulk = list(messages)
+
+
+def test_bulk_delete_drops_messages_that_aged_past_the_cutoff():
+    fresh = FakeMessage(timedelta(days=1))
+    aged = FakeMessage(PurgeEngine.BULK_MAX_AGE + timedelta(seconds=1))
+    channel = FakeChannel()
+    progress = PurgeProgress(1)
+
+    asyncio.run(PurgeEngine.bulk_delete(channel, [fresh, aged], progress))
+
+    assert channel.bulk == [fresh]
+    assert aged.deleted
+    assert (progress.bulk_deleted, progress.single_deleted) == (1, 1)
+
+
+class HistoryChannel(FakeChannel):
+    def __init__(self, messages):
+        super().__init__()
+        self.messages = messages
+        self.deleted_during_scan = 0
+
+    def history(self, limit=None):
+        async def stream():
+            for index, message in enumerate(self.messages):
+                # Old messages must already be gone while the scan is still running
+                if index == len(self.messages) - 1:
+                    self.deleted_during_scan = sum(other.deleted for other in self.messages)
+                yield message
+        return stream()
+
+
+def test_purge_channel_deletes_old_messages_while_scanning():
+    fresh = [FakeMessage(timedelta(days=1)) for _ in range(3)]
+    old = [FakeMessage(timedelta(days=30)) for _ in range(5)]
+    channel = HistoryChannel(fresh + old)
+    progress = PurgeProgress(1)
+
+    asyncio.run(PurgeEngine().purge_channel(channel, lambda message: True, progress))
+
+    assert channel.bulk == fresh
+    assert all(message.deleted for message in old)
+    assert channel.deleted_during_scan == 4
+    assert (progress.bulk_deleted, progress.single_deleted) == (3, 5)
@@ -0,0 +1,53 @@
+import asyncio
+
+from base.utils.metrics import MetricsRegistry
+from base.utils.rename_scheduler import ChannelRenameScheduler, RenameWindow
+
+
+class SlowChannel:
+    def __init__(self, name: str):
+        self.id = 1
+        self.name = name
+
+    async def edit(self, name: str):
+        await asyncio.sleep(0.05)
+        self.name = name
+
+
+def test_window_allows_only_the_limit_per_period():
+    window = RenameWindow(2, 600)
+    window.record()
+    assert window.time_until_slot() == 0
+    window.record()
+    assert window.time_until_slot() > 599
+
+
+def test_request_during_inflight_edit_wins():
+    async def run() -> SlowChannel:
+        scheduler = ChannelRenameScheduler()
+        channel = SlowChannel("online")
+        scheduler.request(channel, "offline")
+        await asyncio.sleep(0.01)
+        scheduler.request(channel, "online")
+        await asyncio.sleep(0.3)
+        return channel
+
+    assert asyncio.run(run()).name == "online"
+
+
+def test_outcomes_are_exported_to_the_registry():
+    registry = MetricsRegistry()
+
+    async def run():
+        scheduler = ChannelRenameScheduler(registry=registry)
+        channel = SlowChannel("online")
+        scheduler.request(channel, "online")
+        scheduler.request(channel, "offline")
+        scheduler.request(channel, "maintenance")
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    counts = {outcome: registry.counter("discord_channel_renames_total", outcome=outcome)
+              for outcome in ChannelRenameScheduler.OUTCOMES}
+    assert counts == {"requested": 3, "applied": 1, "coalesced": 1, "dropped": 1, "failed": 0}
+    assert "discord_channel_renames_total" in registry.render()
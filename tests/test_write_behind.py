@@ -0,0 +1,31 @@
+import asyncio
+
+from base.database import Database
+
+
+def test_close_commits_every_queued_write(tmp_path):
+    path = str(tmp_path / "bot.db")
+
+    async def run():
+        database = Database(path)
+        await database.create_database()
+        database.enable_write_behind(flush_interval_ms=1000, max_batch=100)
+        futures = [
+            database.submit_write("INSERT INTO users (discord_id, username, discriminator) VALUES (?, ?, ?)",
+                                  (user_id, "user", "0"))
+            for user_id in range(250)
+        ]
+        # Let the first full batch start committing before the shutdown
+        await asyncio.sleep(0)
+        await database.close_connections()
+        assert all(future.done() for future in futures)
+        assert sum(future.result() for future in futures) == 250
+
+        reopened = Database(path)
+        async with reopened.get_db_connection() as connection:
+            async with connection.execute("SELECT COUNT(*) FROM users") as cursor:
+                count = (await cursor.fetchone())[0]
+        await reopened.close_connections()
+        return count
+
+    assert asyncio.run(run()) == 250